@@ -62,10 +62,24 @@ setup(
         'dev': [
             'pytest>=7.4.0',
             'pytest-cov>=4.1.0',
+            'pyfakefs>=5.3.0',
+            'pytest-xdist>=3.5.0',
+            'pytest-benchmark>=4.0.0',
             'black>=23.0.0',
             'flake8>=6.0.0',
             'mypy>=1.5.0',
         ],
+        # Optional accelerators; each has a pure-Python fallback
+        'fast': [
+            "uvloop>=0.19.0;sys_platform!='win32'",
+            'httptools>=0.6.0',
+            "hyperscan>=0.7.0;sys_platform!='win32'",
+            'pyahocorasick>=2.0.0',
+            'orjson>=3.9.0',
+            'blake3>=0.4.0',
+            "liburing>=2024.5.1;sys_platform=='linux'",
+            'google-re2>=1.1',
+        ],
         'docs': [
             'sphinx>=7.0.0',
             'sphinx-rtd-theme>=1.3.0',
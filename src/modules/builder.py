@@ -101,8 +101,13 @@ class StructureBuilder:
             create_root: Create root directory if it doesn't exist
             
         Returns:
-            BuildResult with operation details
+            BuildResult with operation details. An empty structure returns
+            at once without touching the filesystem, root included.
         """
+        if not structure:
+            default_path = Path.cwd() / 'root' if output_path is None else output_path
+            return BuildResult(success=True, output_path=os.path.abspath(default_path))
+        
         start_time = datetime.now()
         
         # Set default output path
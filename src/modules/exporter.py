@@ -12,7 +12,7 @@ import tarfile
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -43,6 +43,9 @@ class Exporter:
     Exports project data to various formats.
     """
     
+    # Bytes gathered before iter_export_structure yields a chunk
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
     def __init__(self):
         """Initialize exporter."""
         self.logger = Logger.get_instance()
@@ -105,6 +108,68 @@ class Exporter:
         
         return result
     
+    def iter_export_structure(self,
+                              structure: Dict[str, Any],
+                              format: ExportFormat = ExportFormat.JSON,
+                              pretty: bool = True) -> Iterator[bytes]:
+        """
+        Serialize structure incrementally as UTF-8 chunks.
+        
+        JSON, TXT and Markdown are produced piece by piece; YAML and HTML
+        are rendered whole and yielded as one chunk.
+        
+        Args:
+            structure: Structure dictionary
+            format: Export format
+            pretty: Pretty print (for JSON/YAML)
+            
+        Returns:
+            Iterator of byte chunks of about STREAM_CHUNK_SIZE
+            
+        Raises:
+            ValueError: If format is not a structure export format
+        """
+        if format == ExportFormat.JSON:
+            encoder = json.JSONEncoder(indent=2 if pretty else None,
+                                       ensure_ascii=False, default=str)
+            pieces = encoder.iterencode(structure)
+        elif format == ExportFormat.TXT:
+            pieces = self._iter_lines(self._iter_tree(structure))
+        elif format == ExportFormat.MARKDOWN:
+            pieces = self._iter_lines(self._iter_markdown_structure(structure))
+        elif format == ExportFormat.YAML:
+            pieces = iter((self._to_yaml(structure),))
+        elif format == ExportFormat.HTML:
+            pieces = iter((self._to_html_structure(structure),))
+        else:
+            raise ValueError(f"Unsupported format for structure export: {format}")
+        
+        return self._chunked(pieces)
+    
+    def _chunked(self, pieces: Iterable[str]) -> Iterator[bytes]:
+        """Join string pieces into UTF-8 chunks of about STREAM_CHUNK_SIZE."""
+        buffer = []
+        size = 0
+        for piece in pieces:
+            buffer.append(piece)
+            size += len(piece)
+            if size >= self.STREAM_CHUNK_SIZE:
+                yield ''.join(buffer).encode('utf-8')
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield ''.join(buffer).encode('utf-8')
+    
+    @staticmethod
+    def _iter_lines(lines: Iterable[str]) -> Iterator[str]:
+        """Yield lines with '\n' between them, as '\n'.join would."""
+        first = True
+        for line in lines:
+            if not first:
+                yield '\n'
+            first = False
+            yield line
+    
     def export_content(self,
                        files: List[FileContent],
                        output_path: Path,
@@ -258,7 +323,10 @@ class Exporter:
     
     def _to_tree(self, structure: Dict[str, Any], prefix: str = '') -> str:
         """Convert structure to tree format."""
-        lines = []
+        return '\n'.join(self._iter_tree(structure, prefix))
+    
+    def _iter_tree(self, structure: Dict[str, Any], prefix: str = '') -> Iterator[str]:
+        """Yield the lines of the tree format, depth first."""
         items = sorted(structure.items(), 
                       key=lambda x: (not isinstance(x[1], dict), x[0].lower()))
         
@@ -267,14 +335,12 @@ class Exporter:
             connector = '└── ' if is_last else '├── '
             
             if isinstance(content, dict):
-                lines.append(f"{prefix}{connector}{name}/")
+                yield f"{prefix}{connector}{name}/"
                 if content:
                     extension = '    ' if is_last else '│   '
-                    lines.append(self._to_tree(content, prefix + extension))
+                    yield from self._iter_tree(content, prefix + extension)
             else:
-                lines.append(f"{prefix}{connector}{name}")
-        
-        return '\n'.join(lines)
+                yield f"{prefix}{connector}{name}"
     
     def _to_yaml(self, data: Any) -> str:
         """Convert data to YAML string."""
@@ -308,19 +374,24 @@ class Exporter:
     def _to_markdown_structure(self, structure: Dict[str, Any], 
                                level: int = 0) -> str:
         """Convert structure to Markdown."""
-        lines = []
-        
+        return '\n'.join(self._iter_markdown_structure(structure, level))
+    
+    def _iter_markdown_structure(self, structure: Dict[str, Any],
+                                 level: int = 0) -> Iterator[str]:
+        """Yield the lines of the Markdown structure export."""
         if level == 0:
-            lines.append("# Project Structure\n")
-            lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            lines.append("```")
+            yield "# Project Structure\n"
+            yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            yield "```"
         
-        lines.append(self._to_tree(structure))
+        if structure:
+            yield from self._iter_tree(structure)
+        else:
+            # Keep the empty line the joined tree string left here
+            yield ''
         
         if level == 0:
-            lines.append("```")
-        
-        return '\n'.join(lines)
+            yield "```"
     
     def _to_html_structure(self, structure: Dict[str, Any]) -> str:
         """Convert structure to HTML."""
@@ -11,7 +11,7 @@ Features:
 import os
 import fnmatch
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Callable, Tuple
+from typing import Dict, Any, List, Optional, Set, Callable, Tuple, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -159,25 +159,12 @@ class ProjectScanner:
             root_path=str(path)
         )
         
-        # Build ignore patterns
-        all_ignore = set(Config.DEFAULT_IGNORE_PATTERNS)
-        all_ignore.update(self.ignore_patterns)
-        if custom_ignore:
-            all_ignore.update(custom_ignore)
-        
-        # Load .structureignore if present
-        structureignore = path / '.structureignore'
-        if structureignore.exists():
-            all_ignore.update(self._load_ignore_file(structureignore))
-        
         # Auto-detect project type
         if auto_detect_project:
             result.project_type = self.detector.detect(path)
             self.logger.info(f"Detected project type: {result.project_type.name}")
-            
-            # Add project-specific ignore patterns
-            project_patterns = Config.PROJECT_IGNORE_PATTERNS.get(result.project_type, [])
-            all_ignore.update(project_patterns)
+        
+        all_ignore = self._build_ignore_patterns(path, result.project_type, custom_ignore)
         
         # Scan directory
         try:
@@ -219,6 +206,106 @@ class ProjectScanner:
         
         return result
     
+    def iter_scan(self,
+                  path: Path,
+                  recursive: bool = True,
+                  include_hidden: bool = False,
+                  follow_symlinks: bool = False,
+                  auto_detect_project: bool = True,
+                  custom_ignore: Optional[List[str]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Walk a project directory, yielding entries as they are found.
+        
+        Applies the same ignore rules as scan() but builds no structure,
+        file list or binary checks, so the first entries are available
+        before the walk finishes. Each directory's entries are yielded
+        before its subdirectories are entered.
+        
+        Args:
+            path: Path to scan
+            recursive: Scan subdirectories
+            include_hidden: Include hidden files/directories
+            follow_symlinks: Follow symbolic links
+            auto_detect_project: Apply project-type ignore patterns
+            custom_ignore: Additional ignore patterns
+            
+        Returns:
+            Iterator of (relative_path, {'type', 'size', 'modified'}) tuples
+            
+        Raises:
+            FileNotFoundError: If path does not exist
+            NotADirectoryError: If path is not a directory
+        """
+        path = Path(path).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"Path does not exist: {path}")
+        if not path.is_dir():
+            raise NotADirectoryError(f"Path is not a directory: {path}")
+        
+        project_type = self.detector.detect(path) if auto_detect_project else ProjectType.UNKNOWN
+        ignore_patterns = frozenset(self._build_ignore_patterns(path, project_type, custom_ignore))
+        return self._iter_entries(path, recursive, ignore_patterns, include_hidden, follow_symlinks)
+    
+    def _iter_entries(self,
+                      root_path: Path,
+                      recursive: bool,
+                      ignore_patterns: frozenset,
+                      include_hidden: bool,
+                      follow_symlinks: bool) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Walk root_path with os.scandir for iter_scan."""
+        stack = [(str(root_path), '')]
+        while stack:
+            dir_path, prefix = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
+            except OSError as e:
+                self.logger.debug(f"Error reading directory {dir_path}: {e}")
+                continue
+            
+            sub_dirs = []
+            for entry in entries:
+                relative_str = prefix + entry.name
+                if self._should_skip(entry.name, relative_str, ignore_patterns, include_hidden):
+                    continue
+                if entry.is_symlink() and not follow_symlinks:
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                    st = entry.stat()
+                except OSError:
+                    continue
+                
+                yield relative_str, {
+                    'type': 'dir' if is_dir else 'file',
+                    'size': 0 if is_dir else st.st_size,
+                    'modified': st.st_mtime,
+                }
+                if is_dir and recursive:
+                    sub_dirs.append((entry.path, relative_str + '/'))
+            
+            # Reversed so subdirectories are entered in sorted order
+            stack.extend(reversed(sub_dirs))
+    
+    def _build_ignore_patterns(self,
+                               path: Path,
+                               project_type: ProjectType,
+                               custom_ignore: Optional[List[str]] = None) -> Set[str]:
+        """Collect default, configured, .structureignore and project patterns."""
+        all_ignore = set(Config.DEFAULT_IGNORE_PATTERNS)
+        all_ignore.update(self.ignore_patterns)
+        if custom_ignore:
+            all_ignore.update(custom_ignore)
+        
+        # Load .structureignore if present
+        structureignore = path / '.structureignore'
+        if structureignore.exists():
+            all_ignore.update(self._load_ignore_file(structureignore))
+        
+        # Add project-specific ignore patterns
+        all_ignore.update(Config.PROJECT_IGNORE_PATTERNS.get(project_type, []))
+        return all_ignore
+    
     def _scan_recursive(self, 
                         current_path: Path,
                         root_path: Path,
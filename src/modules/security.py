@@ -14,15 +14,29 @@ import hmac
 import base64
 import secrets
 import re
+import sys
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Iterator
 from dataclasses import dataclass, field
 
 from ..config import Config
 from .logger import Logger
 
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.primitives import padding
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives import hashes
+    CRYPTO_AVAILABLE = True
+except ImportError:
+    CRYPTO_AVAILABLE = False
 
-@dataclass
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class SensitiveMatch:
     """Represents a detected sensitive data match."""
     file: str
@@ -32,16 +46,10 @@ class SensitiveMatch:
     context: str
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'file': self.file,
-            'line': self.line,
-            'pattern_type': self.pattern_type,
-            'match': self.match,
-            'context': self.context,
-        }
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
 
 
-@dataclass 
+@dataclass(**_SLOTS)
 class SecurityScanResult:
     """Result of security scan."""
     has_sensitive_data: bool
@@ -76,6 +84,24 @@ class SecurityManager:
         'bearer_token': r'(?i)bearer\s+[a-zA-Z0-9_\-\.]+',
     }
     
+    # Compiled once; scanning runs these against every line of every file
+    _COMPILED_PATTERNS = {
+        name: re.compile(pattern) for name, pattern in SENSITIVE_PATTERNS.items()
+    }
+    
+    # Literal anchors shared by the patterns above. A line without any of
+    # these cannot match, so it skips the full pattern set.
+    _TRIGGER_RE = re.compile(
+        r'(?i)api|passw|pwd|secret|private|token|aws|-----BEGIN|'
+        r'mongodb|mysql|postgres|redis|eyJ|bearer'
+    )
+    
+    # Prefix up to the first ':' or '=', then the value without surrounding
+    # whitespace and quotes
+    _MASK_RE = re.compile(
+        r'(?P<prefix>[^:=]*[:=])\s*["\']*(?P<val>.*?)["\']*\s*\Z', re.DOTALL
+    )
+    
     # Sensitive file patterns
     SENSITIVE_FILE_PATTERNS = [
         '*.pem', '*.key', '*.crt', '*.cer', '*.p12', '*.pfx',
@@ -87,16 +113,9 @@ class SecurityManager:
     def __init__(self):
         """Initialize security manager."""
         self.logger = Logger.get_instance()
-        self._crypto_available = False
+        self._crypto_available = CRYPTO_AVAILABLE
         
-        try:
-            from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-            from cryptography.hazmat.primitives import padding
-            from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-            from cryptography.hazmat.primitives import hashes
-            from cryptography.hazmat.backends import default_backend
-            self._crypto_available = True
-        except ImportError:
+        if not self._crypto_available:
             self.logger.warn("cryptography library not available - encryption disabled")
     
     def encrypt(self, data: bytes, password: str) -> bytes:
@@ -113,12 +132,6 @@ class SecurityManager:
         if not self._crypto_available:
             raise RuntimeError("Encryption not available - install cryptography library")
         
-        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-        from cryptography.hazmat.primitives import padding
-        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.backends import default_backend
-        
         # Generate salt and IV
         salt = secrets.token_bytes(self.SALT_SIZE)
         iv = secrets.token_bytes(self.IV_SIZE)
@@ -128,8 +141,7 @@ class SecurityManager:
             algorithm=hashes.SHA256(),
             length=self.KEY_SIZE,
             salt=salt,
-            iterations=self.ITERATIONS,
-            backend=default_backend()
+            iterations=self.ITERATIONS
         )
         key = kdf.derive(password.encode())
         
@@ -138,7 +150,7 @@ class SecurityManager:
         padded_data = padder.update(data) + padder.finalize()
         
         # Encrypt
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+        cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
         encryptor = cipher.encryptor()
         encrypted = encryptor.update(padded_data) + encryptor.finalize()
         
@@ -163,12 +175,6 @@ class SecurityManager:
         if not self._crypto_available:
             raise RuntimeError("Decryption not available - install cryptography library")
         
-        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-        from cryptography.hazmat.primitives import padding
-        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.backends import default_backend
-        
         # Extract HMAC
         hmac_size = 32
         received_hmac = data[-hmac_size:]
@@ -184,8 +190,7 @@ class SecurityManager:
             algorithm=hashes.SHA256(),
             length=self.KEY_SIZE,
             salt=salt,
-            iterations=self.ITERATIONS,
-            backend=default_backend()
+            iterations=self.ITERATIONS
         )
         key = kdf.derive(password.encode())
         
@@ -195,7 +200,7 @@ class SecurityManager:
             raise ValueError("Invalid password or corrupted data")
         
         # Decrypt
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+        cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
         decryptor = cipher.decryptor()
         padded = decryptor.update(ciphertext) + decryptor.finalize()
         
@@ -248,25 +253,32 @@ class SecurityManager:
         Returns:
             List of SensitiveMatch objects
         """
-        matches = []
+        return list(self._iter_matches(content, filename))
+    
+    def _iter_matches(self, content: str, filename: str = '') -> Iterator[SensitiveMatch]:
+        """Yield sensitive data matches in content one at a time."""
+        trigger = self._TRIGGER_RE.search
+        if not trigger(content):
+            return
+        
         lines = content.split('\n')
         
         for line_num, line in enumerate(lines, 1):
-            for pattern_type, pattern in self.SENSITIVE_PATTERNS.items():
-                for match in re.finditer(pattern, line):
+            if not trigger(line):
+                continue
+            for pattern_type, pattern in self._COMPILED_PATTERNS.items():
+                for match in pattern.finditer(line):
                     # Mask the actual sensitive value
                     full_match = match.group(0)
                     masked = self._mask_sensitive(full_match)
                     
-                    matches.append(SensitiveMatch(
+                    yield SensitiveMatch(
                         file=filename,
                         line=line_num,
                         pattern_type=pattern_type,
                         match=masked,
                         context=self._get_context(line, match.start())
-                    ))
-        
-        return matches
+                    )
     
     def scan_directory(self, path: Path) -> SecurityScanResult:
         """
@@ -286,39 +298,58 @@ class SecurityManager:
         
         text_extensions = Config.TEXT_EXTENSIONS
         
-        for file_path in path.rglob('*'):
-            if not file_path.is_file():
-                continue
-            
+        for entry in self._iter_files(path, result):
             result.files_scanned += 1
+            name = entry.name
             
             # Check if it's a sensitive filename
-            if self._is_sensitive_filename(file_path.name):
+            if self._is_sensitive_filename(name):
                 result.matches.append(SensitiveMatch(
-                    file=str(file_path),
+                    file=entry.path,
                     line=0,
                     pattern_type='sensitive_file',
-                    match=file_path.name,
+                    match=name,
                     context='Sensitive filename detected'
                 ))
                 result.has_sensitive_data = True
             
             # Scan text files for sensitive content
-            if file_path.suffix.lower() in text_extensions:
+            if os.path.splitext(name)[1].lower() in text_extensions:
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    with open(entry.path, 'r', encoding='utf-8', errors='ignore') as f:
                         content = f.read()
                     
-                    matches = self.scan_for_sensitive_data(content, str(file_path))
-                    if matches:
-                        result.matches.extend(matches)
+                    found = len(result.matches)
+                    result.matches.extend(self._iter_matches(content, entry.path))
+                    if len(result.matches) > found:
                         result.has_sensitive_data = True
                         
                 except Exception as e:
-                    result.warnings.append(f"Error scanning {file_path}: {e}")
+                    result.warnings.append(f"Error scanning {entry.path}: {e}")
         
         return result
     
+    @staticmethod
+    def _iter_files(root: Path, result: SecurityScanResult):
+        """
+        Yield regular files under root as os.DirEntry objects.
+        
+        Uses os.scandir so the file type comes from the cached
+        directory entry instead of a separate stat() per path.
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+            except OSError as e:
+                result.warnings.append(f"Error scanning {current}: {e}")
+    
     def sanitize_content(self, content: str) -> str:
         """
         Remove or mask sensitive data from content.
@@ -329,8 +360,11 @@ class SecurityManager:
         Returns:
             Sanitized content
         """
-        for pattern in self.SENSITIVE_PATTERNS.values():
-            content = re.sub(pattern, lambda m: self._mask_sensitive(m.group(0)), content)
+        if not self._TRIGGER_RE.search(content):
+            return content
+        
+        for pattern in self._COMPILED_PATTERNS.values():
+            content = pattern.sub(lambda m: self._mask_sensitive(m.group(0)), content)
         
         return content
     
@@ -344,11 +378,10 @@ class SecurityManager:
     
     def _mask_sensitive(self, text: str) -> str:
         """Mask sensitive value in text."""
-        # Find the value part (after : or = sign)
-        if ':' in text or '=' in text:
-            sep_idx = max(text.find(':'), text.find('='))
-            prefix = text[:sep_idx + 1]
-            value = text[sep_idx + 1:].strip().strip('"\'')
+        # Split into "key:" / "key=" prefix and the unquoted value
+        m = self._MASK_RE.match(text)
+        if m:
+            prefix, value = m.group('prefix', 'val')
             if len(value) > 4:
                 masked = value[:2] + '*' * (len(value) - 4) + value[-2:]
             else:
@@ -5,6 +5,8 @@ Validates project structures for correctness and consistency.
 
 import re
 import os
+import sys
+import fnmatch
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
@@ -13,6 +15,10 @@ from enum import Enum, auto
 from .logger import Logger
 
 
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class ValidationLevel(Enum):
     """Validation issue severity levels."""
     INFO = auto()
@@ -21,7 +27,7 @@ class ValidationLevel(Enum):
     CRITICAL = auto()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationIssue:
     """Represents a single validation issue."""
     level: ValidationLevel
@@ -38,7 +44,7 @@ class ValidationIssue:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Result of validation operation."""
     is_valid: bool
@@ -86,11 +92,11 @@ class StructureValidator:
     UNIX_INVALID_CHARS = '/\x00'
     
     # Reserved names on Windows
-    WINDOWS_RESERVED_NAMES = {
+    WINDOWS_RESERVED_NAMES = frozenset({
         'CON', 'PRN', 'AUX', 'NUL',
         'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
         'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9',
-    }
+    })
     
     # Maximum path length
     MAX_PATH_LENGTH = 260  # Windows default
@@ -107,6 +113,8 @@ class StructureValidator:
         self.logger = Logger.get_instance()
         self.ignore_patterns = ignore_patterns or []
         self.is_windows = os.name == 'nt'
+        self._check_reserved = self.is_windows
+        self._rebuild_ignore_regexes()
     
     def validate(self, structure: Dict[str, Any], 
                  output_path: Optional[Path] = None) -> ValidationResult:
@@ -243,8 +251,8 @@ class StructureValidator:
             )
         
         # Check for reserved names (Windows)
-        if self.is_windows:
-            base_name = name.split('.')[0].upper()
+        if self._check_reserved:
+            base_name = name.partition('.')[0].upper()
             if base_name in self.WINDOWS_RESERVED_NAMES:
                 result.add_issue(
                     ValidationLevel.ERROR,
@@ -289,25 +297,41 @@ class StructureValidator:
     
     def _is_ignored(self, path: str) -> bool:
         """Check if path matches any ignore pattern."""
-        import fnmatch
+        if self._dir_re is None and self._file_re is None:
+            return False
         
-        path_normalized = path.replace('\\', '/')
-        path_parts = path_normalized.split('/')
+        path_normalized = os.path.normcase(path.replace('\\', '/'))
+        path_parts = path_normalized.replace('\\', '/').split('/')
         
-        for pattern in self.ignore_patterns:
-            # Directory pattern
-            if pattern.endswith('/'):
-                pattern_name = pattern[:-1]
-                if any(fnmatch.fnmatch(part, pattern_name) for part in path_parts):
-                    return True
-            # File pattern
-            elif fnmatch.fnmatch(path_normalized, pattern):
+        # Directory patterns match any path component
+        if self._dir_re is not None:
+            dir_match = self._dir_re.match
+            if any(dir_match(part) for part in path_parts):
+                return True
+        
+        # File patterns match the full path or the base name
+        if self._file_re is not None:
+            if self._file_re.match(path_normalized):
                 return True
-            elif fnmatch.fnmatch(path_parts[-1] if path_parts else '', pattern):
+            if self._file_re.match(path_parts[-1] if path_parts else ''):
                 return True
         
         return False
     
+    def _rebuild_ignore_regexes(self) -> None:
+        """Compile ignore patterns into one regex per pattern kind."""
+        dir_patterns = []
+        file_patterns = []
+        
+        for pattern in self.ignore_patterns:
+            if pattern.endswith('/'):
+                dir_patterns.append(fnmatch.translate(os.path.normcase(pattern[:-1])))
+            else:
+                file_patterns.append(fnmatch.translate(os.path.normcase(pattern)))
+        
+        self._dir_re = re.compile('|'.join(dir_patterns)) if dir_patterns else None
+        self._file_re = re.compile('|'.join(file_patterns)) if file_patterns else None
+    
     def _check_output_conflicts(self, structure: Dict[str, Any], 
                                 output_path: Path, 
                                 result: ValidationResult) -> None:
@@ -350,14 +374,15 @@ class StructureValidator:
             return patterns
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith('#'):
-                        patterns.append(line)
+            text = filepath.read_text(encoding='utf-8')
+            # Skip empty lines and comments
+            patterns = [
+                line for line in (raw.strip() for raw in text.splitlines())
+                if line and not line.startswith('#')
+            ]
             
             self.ignore_patterns.extend(patterns)
+            self._rebuild_ignore_regexes()
             
         except Exception as e:
             self.logger.warn(f"Error loading ignore file: {e}")
@@ -367,11 +392,13 @@ class StructureValidator:
     def set_ignore_patterns(self, patterns: List[str]) -> None:
         """Set ignore patterns."""
         self.ignore_patterns = patterns
+        self._rebuild_ignore_regexes()
     
     def add_ignore_pattern(self, pattern: str) -> None:
         """Add a single ignore pattern."""
         if pattern not in self.ignore_patterns:
             self.ignore_patterns.append(pattern)
+            self._rebuild_ignore_regexes()
 
 
 # Create singleton instance
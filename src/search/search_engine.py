@@ -5,15 +5,111 @@ Advanced search with regex, filters, and content search.
 
 import re
 import os
+import sys
+import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Union, Callable
+from typing import Dict, Any, List, Optional, Set, Union, Callable, Iterable, Iterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+)
+from functools import lru_cache
+from operator import itemgetter, attrgetter
+import heapq
 import fnmatch
+import threading
+import multiprocessing
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
-@dataclass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# SearchMatch.match_type values
+MATCH_FILENAME = 'filename'
+MATCH_CONTENT = 'content'
+MATCH_PATH = 'path'
+
+# Column order of SearchResult.to_records()
+MATCH_COLUMNS = ('path', 'filename', 'line_number', 'column',
+                 'context', 'match_text', 'match_type')
+
+# Leading bytes checked for NUL when sniffing binary files
+BINARY_SNIFF_SIZE = 8192
+
+# Files at least this large are dropped from the page cache after a scan
+DROP_CACHE_MIN_SIZE = 4 * 1024 * 1024
+
+# Kernel read-ahead hints (POSIX/Linux only)
+_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Per-thread Hyperscan scratch space
+_hs_local = threading.local()
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: Union[str, bytes], flags: int = 0) -> re.Pattern:
+    """Compile a search pattern, reusing the result for repeated searches."""
+    return re.compile(pattern, flags)
+
+
+def _decode(data: bytes) -> str:
+    """Decode file bytes the way content search reports them."""
+    return data.decode('utf-8', errors='ignore')
+
+
+# Pattern fragments the Hyperscan prefilter cannot screen for soundly.
+# Python reads a{,n} as a{0,n}; PCRE treats it as a literal. \A and \Z
+# anchor to every line when matching per line but not in a whole-file
+# scan. Python's \s also covers \x1c-\x1f, which PCRE's does not.
+_PREFILTER_UNSAFE = (b'{,', b'\\A', b'\\Z', b'\\s')
+
+
+@lru_cache(maxsize=128)
+def _compile_prefilter(pattern: bytes, flags: int = 0) -> Optional['hyperscan.Database']:
+    """
+    Compile a content pattern into a Hyperscan prefilter database.
+    
+    Prefilter mode may accept text the real regex rejects but never the
+    reverse, so a miss proves a file has no matches. Returns None when
+    Hyperscan is not installed or cannot compile the pattern.
+    """
+    if not HYPERSCAN_AVAILABLE or any(token in pattern for token in _PREFILTER_UNSAFE):
+        return None
+    
+    hs_flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH |
+                hyperscan.HS_FLAG_ALLOWEMPTY | hyperscan.HS_FLAG_MULTILINE)
+    if flags & re.IGNORECASE:
+        hs_flags |= hyperscan.HS_FLAG_CASELESS
+    
+    database = hyperscan.Database()
+    try:
+        database.compile(expressions=[pattern], ids=[0],
+                         elements=1, flags=hs_flags)
+    except hyperscan.error:
+        return None
+    return database
+
+
+@dataclass(**_SLOTS)
 class SearchMatch:
     """A search match result."""
     path: str
@@ -22,7 +118,7 @@ class SearchMatch:
     column: Optional[int] = None
     context: str = ''
     match_text: str = ''
-    match_type: str = 'filename'  # 'filename', 'content', 'path'
+    match_type: str = MATCH_FILENAME  # MATCH_FILENAME, MATCH_CONTENT, MATCH_PATH
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -52,53 +148,92 @@ class SearchFilter:
     exclude_dirs: Optional[List[str]] = None
     include_hidden: bool = False
     
-    def matches(self, file_path: Path, stat: os.stat_result) -> bool:
-        """Check if file matches all filters."""
+    def __post_init__(self):
+        """Precompute lookup sets and timestamps used by matches()."""
+        self._ext_set = (frozenset(e.lower() for e in self.extensions)
+                         if self.extensions else None)
+        self._exclude_ext_set = (frozenset(e.lower() for e in self.exclude_extensions)
+                                 if self.exclude_extensions else None)
+        self._exclude_dirs_set = frozenset(self.exclude_dirs or ())
+        self._modified_after_ts = self.modified_after.timestamp() if self.modified_after else None
+        self._modified_before_ts = self.modified_before.timestamp() if self.modified_before else None
+        self._created_after_ts = self.created_after.timestamp() if self.created_after else None
+        self._created_before_ts = self.created_before.timestamp() if self.created_before else None
+        self._check_size = bool(self.min_size or self.max_size)
+        self._check_mtime = (self._modified_after_ts is not None or
+                             self._modified_before_ts is not None)
+        self._check_ctime = (self._created_after_ts is not None or
+                             self._created_before_ts is not None)
+    
+    def matches(self, entry: Union[os.DirEntry, Path, str],
+                stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Check if file matches all filters.
+        
+        Args:
+            entry: Directory entry or path of the file
+            stat: Stat result for the file; defaults to entry.stat(),
+                which os.scandir caches, or os.stat() for a path
+        """
+        if isinstance(entry, os.DirEntry):
+            name, path_str = entry.name, entry.path
+        else:
+            path_str = os.fspath(entry)
+            name = os.path.basename(path_str)
+        
         try:
             # Hidden files
-            if not self.include_hidden and file_path.name.startswith('.'):
+            if not self.include_hidden and name.startswith('.'):
                 return False
             
             # Extensions
-            ext = file_path.suffix.lower()
-            if self.extensions and ext not in [e.lower() for e in self.extensions]:
-                return False
-            if self.exclude_extensions and ext in [e.lower() for e in self.exclude_extensions]:
-                return False
+            if self._ext_set is not None or self._exclude_ext_set is not None:
+                ext = os.path.splitext(name)[1].lower()
+                if self._ext_set is not None and ext not in self._ext_set:
+                    return False
+                if self._exclude_ext_set is not None and ext in self._exclude_ext_set:
+                    return False
             
-            # Size
-            size = stat.st_size
-            if self.min_size and size < self.min_size:
-                return False
-            if self.max_size and size > self.max_size:
-                return False
-            
-            # Modification time
-            mtime = datetime.fromtimestamp(stat.st_mtime)
-            if self.modified_after and mtime < self.modified_after:
-                return False
-            if self.modified_before and mtime > self.modified_before:
-                return False
-            
-            # Creation time
-            ctime = datetime.fromtimestamp(stat.st_ctime)
-            if self.created_after and ctime < self.created_after:
-                return False
-            if self.created_before and ctime > self.created_before:
-                return False
+            # Stat fields are read once each, and only when filtered on
+            if self._check_size or self._check_mtime or self._check_ctime:
+                if stat is None:
+                    stat = (entry.stat() if isinstance(entry, os.DirEntry)
+                            else os.stat(path_str))
+                
+                # Size
+                if self._check_size:
+                    size = stat.st_size
+                    if self.min_size and size < self.min_size:
+                        return False
+                    if self.max_size and size > self.max_size:
+                        return False
+                
+                # Modification time
+                if self._check_mtime:
+                    mtime = stat.st_mtime
+                    if self._modified_after_ts is not None and mtime < self._modified_after_ts:
+                        return False
+                    if self._modified_before_ts is not None and mtime > self._modified_before_ts:
+                        return False
+                
+                # Creation time
+                if self._check_ctime:
+                    ctime = stat.st_ctime
+                    if self._created_after_ts is not None and ctime < self._created_after_ts:
+                        return False
+                    if self._created_before_ts is not None and ctime > self._created_before_ts:
+                        return False
             
             # Path patterns
-            path_str = str(file_path)
-            if self.path_contains and self.path_contains not in path_str:
-                return False
-            if self.path_not_contains and self.path_not_contains in path_str:
-                return False
+            if self.path_contains or self.path_not_contains:
+                if self.path_contains and self.path_contains not in path_str:
+                    return False
+                if self.path_not_contains and self.path_not_contains in path_str:
+                    return False
             
             # Exclude directories
-            if self.exclude_dirs:
-                for dir_name in self.exclude_dirs:
-                    if dir_name in file_path.parts:
-                        return False
+            if self._exclude_dirs_set and not self._exclude_dirs_set.isdisjoint(path_str.split(os.sep)):
+                return False
             
             return True
         except (PermissionError, OSError):
@@ -128,6 +263,278 @@ class SearchResult:
             'matches': [m.to_dict() for m in self.matches],
             'errors': self.errors,
         }
+    
+    def to_records(self) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+        """
+        Get matches as rows of a table.
+        
+        Returns:
+            (MATCH_COLUMNS, one tuple per match in that column order)
+        """
+        row = attrgetter(*MATCH_COLUMNS)
+        return MATCH_COLUMNS, [row(m) for m in self.matches]
+    
+    def to_json(self) -> str:
+        """
+        Serialize to JSON, with matches stored as columns and rows.
+        
+        Uses orjson when installed.
+        """
+        columns, rows = self.to_records()
+        data = {
+            'query': self.query,
+            'is_regex': self.is_regex,
+            'search_type': self.search_type,
+            'total_matches': self.total_matches,
+            'files_searched': self.files_searched,
+            'search_time_ms': self.search_time_ms,
+            'columns': columns,
+            'rows': rows,
+            'errors': self.errors,
+        }
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data).decode('utf-8')
+        return json.dumps(data, ensure_ascii=False)
+
+
+def _prefilter_hit(database: 'hyperscan.Database', data: bytes) -> bool:
+    """Check data against a Hyperscan prefilter using a per-thread scratch."""
+    scratches = getattr(_hs_local, 'scratches', None)
+    if scratches is None:
+        scratches = _hs_local.scratches = {}
+    scratch = scratches.get(database)
+    if scratch is None:
+        scratch = scratches[database] = hyperscan.Scratch(database)
+    
+    try:
+        # Returning True from the handler stops the scan at the first hit
+        database.scan(data, match_event_handler=lambda *args: True,
+                      scratch=scratch)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+@lru_cache(maxsize=32)
+def _compile_multi_literal(literals: Optional[Tuple[str, ...]]
+                           ) -> Optional['ahocorasick.Automaton']:
+    """
+    Build an Aho-Corasick automaton over lowercased keywords.
+    
+    Returns None when no keywords are given or pyahocorasick is not
+    installed.
+    """
+    if not literals or not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for word in literals:
+        automaton.add_word(word.lower(), len(word))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Check for a regex word character in ASCII text."""
+    return char == '_' or (char.isascii() and char.isalnum())
+
+
+def _multi_literal_hit(automaton: 'ahocorasick.Automaton', text: str) -> bool:
+    """Check whether any automaton keyword occurs in ASCII text as a whole word."""
+    # ASCII lowercasing keeps every offset in place
+    text = text.lower()
+    last = len(text) - 1
+    
+    for end, length in automaton.iter(text):
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        return True
+    return False
+
+
+# Lookarounds can see past the end of a line, \A/\Z anchor to the whole
+# text and \B matches between two newlines but not in an empty line, so
+# patterns using them are matched one line at a time
+_LINE_SCAN_RE = re.compile(r'\(\?<?[=!]|\\[ABZ]')
+
+
+@lru_cache(maxsize=128)
+def _needs_line_scan(pattern: str) -> bool:
+    """Check whether a content pattern must be matched line by line."""
+    return _LINE_SCAN_RE.search(pattern) is not None
+
+
+def _content_match(path_str: str, filename: str, text: str, limit: int,
+                   line_num: int, line_start: int, line_end: int,
+                   offset: int, match_text: str, context_lines: int) -> SearchMatch:
+    """Build the SearchMatch for a match offset characters into a line of text."""
+    context = ''
+    if context_lines > 0:
+        ctx_start = line_start
+        for _ in range(context_lines):
+            if ctx_start == 0:
+                break
+            ctx_start = text.rfind('\n', 0, ctx_start - 1) + 1
+        ctx_end = line_end
+        for _ in range(context_lines):
+            if ctx_end >= limit:
+                break
+            ctx_newline = text.find('\n', ctx_end + 1, limit)
+            ctx_end = limit if ctx_newline < 0 else ctx_newline
+        context = text[ctx_start:ctx_end].strip()
+    
+    return SearchMatch(
+        path=path_str,
+        filename=filename,
+        line_number=line_num,
+        column=offset + 1,
+        context=context or text[line_start:line_end].strip(),
+        match_text=match_text,
+        match_type=MATCH_CONTENT
+    )
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    """Get a start method that is safe to use from a threaded process."""
+    # Forking a process that runs threads (the web API searches from a
+    # thread pool) can copy a held lock into the child
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _search_file_content(path_str: str,
+                         pattern: str,
+                         flags: int,
+                         context_lines: int,
+                         max_matches: int,
+                         use_prefilter: bool = False,
+                         literals: Optional[Tuple[str, ...]] = None) -> List[SearchMatch]:
+    """
+    Search the content of a single file.
+    
+    Module-level so it can run in a worker process. Returns no matches for
+    unreadable, empty or binary files.
+    
+    Args:
+        path_str: File to search
+        pattern: Regex source
+        flags: re flags for pattern
+        context_lines: Number of context lines around match
+        max_matches: Max matches to return
+        use_prefilter: Rule the file out with the Hyperscan prefilter first
+        literals: Case-insensitive keywords; the file is skipped unless one
+            occurs as a whole word
+    
+    Returns:
+        List of SearchMatch
+    """
+    matches = []
+    regex = _compile_pattern(pattern, flags)
+    prefilter = None
+    if use_prefilter and pattern.isascii():
+        prefilter = _compile_prefilter(pattern.encode('ascii'), flags)
+        # Hyperscan's ^ and $ only treat \n as a line break
+        cr_sensitive = '^' in pattern or '$' in pattern
+    automaton = _compile_multi_literal(literals)
+    
+    try:
+        with open(path_str, 'rb') as f:
+            fd = f.fileno()
+            
+            # The whole file is read front to back; let the kernel read ahead
+            if _FADVISE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            data = f.read()
+            
+            # Drop large files from the page cache so one scan does not
+            # evict the rest of the tree
+            if _FADVISE and len(data) >= DROP_CACHE_MIN_SIZE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        return matches
+    
+    # NUL in the leading bytes marks a binary file
+    if not data or data.find(b'\x00', 0, BINARY_SNIFF_SIZE) >= 0:
+        return matches
+    
+    # Skip the regex when a prefilter rules out a match. Both only agree
+    # with the str regex on ASCII text.
+    ascii_text = data.isascii()
+    if (ascii_text and prefilter is not None and not (cr_sensitive and b'\r' in data)
+            and not _prefilter_hit(prefilter, data)):
+        return matches
+    
+    # Decode and translate newlines as a text-mode read would
+    text = _decode(data)
+    del data
+    if ascii_text and automaton is not None and not _multi_literal_hit(automaton, text):
+        return matches
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    # Every match in this file shares the same path strings
+    path_str = sys.intern(path_str)
+    filename = sys.intern(os.path.basename(path_str))
+    
+    # A trailing newline ends the last line rather than starting another
+    limit = len(text) - 1 if text.endswith('\n') else len(text)
+    if limit < 0:
+        return matches
+    
+    # One finditer over the whole text; line numbers come from counting
+    # newlines between consecutive matches
+    scan_from = 0
+    if not _needs_line_scan(pattern):
+        line_num = 1
+        counted_to = 0
+        line_start, line_end = 0, -1
+        for match in regex.finditer(text, 0, limit):
+            start = match.start()
+            if not line_start <= start <= line_end:
+                line_num += text.count('\n', counted_to, start)
+                counted_to = start
+                line_start = text.rfind('\n', 0, start) + 1
+                line_end = text.find('\n', start, limit)
+                if line_end < 0:
+                    line_end = limit
+            
+            # A match running past its line end would not exist line by
+            # line; rescan from this line one line at a time
+            if match.end() > line_end:
+                while matches and matches[-1].line_number == line_num:
+                    matches.pop()
+                scan_from = line_start
+                break
+            
+            matches.append(_content_match(path_str, filename, text, limit, line_num,
+                                          line_start, line_end, start - line_start,
+                                          match.group(), context_lines))
+            if len(matches) >= max_matches:
+                return matches
+        else:
+            return matches
+    
+    line_num = text.count('\n', 0, scan_from) + 1
+    line_start = scan_from
+    while line_start <= limit:
+        line_end = text.find('\n', line_start, limit)
+        if line_end < 0:
+            line_end = limit
+        for match in regex.finditer(text[line_start:line_end]):
+            matches.append(_content_match(path_str, filename, text, limit, line_num,
+                                          line_start, line_end, match.start(),
+                                          match.group(), context_lines))
+            if len(matches) >= max_matches:
+                return matches
+        line_start = line_end + 1
+        line_num += 1
+    
+    return matches
 
 
 class SearchEngine:
@@ -151,15 +558,24 @@ class SearchEngine:
         '.pyc', '.pyo', '.class', '.jar', '.war',
     }
     
-    def __init__(self, max_workers: int = 4):
+    # Content search skips files larger than this (bytes)
+    DEFAULT_MAX_FILE_SIZE = 16 * 1024 * 1024
+    
+    # Below this many files a process pool costs more than it saves
+    PROCESS_POOL_MIN_FILES = 200
+    
+    def __init__(self, max_workers: int = 4,
+                 max_file_size: int = DEFAULT_MAX_FILE_SIZE):
         """
         Initialize search engine.
         
         Args:
             max_workers: Number of parallel workers
+            max_file_size: Largest file (bytes) searched by content search
         """
         self.max_workers = max_workers
-        self._cancel_flag = False
+        self.max_file_size = max_file_size
+        self._cancel = threading.Event()
     
     def search_filename(self,
                        search_path: Path,
@@ -188,14 +604,13 @@ class SearchEngine:
         errors: List[str] = []
         
         filters = filters or SearchFilter()
-        if not filters.exclude_dirs:
-            filters.exclude_dirs = self.DEFAULT_EXCLUDE_DIRS
+        exclude_dirs = filters.exclude_dirs or self.DEFAULT_EXCLUDE_DIRS
         
         # Compile pattern
         if is_regex:
             flags = 0 if case_sensitive else re.IGNORECASE
             try:
-                regex = re.compile(pattern, flags)
+                regex = _compile_pattern(pattern, flags)
             except re.error as e:
                 return SearchResult(
                     query=pattern,
@@ -209,42 +624,38 @@ class SearchEngine:
         else:
             if not case_sensitive:
                 pattern = pattern.lower()
+            # Substring glob, translated once instead of per file
+            glob_match = _compile_pattern(fnmatch.translate(f'*{pattern}*')).match
         
-        for file_path in search_path.rglob('*'):
-            if self._cancel_flag:
-                break
-            
-            if not file_path.is_file():
-                continue
-            
+        # The walker stops at the next directory once cancelled
+        for entry, stat in self._iter_files_parallel(search_path, exclude_dirs):
             try:
-                stat = file_path.stat()
-                if not filters.matches(file_path, stat):
+                if not filters.matches(entry, stat):
                     continue
                 
                 files_searched += 1
-                filename = file_path.name
+                filename = entry.name
                 
                 # Match check
                 if is_regex:
                     if regex.search(filename):
                         matches.append(SearchMatch(
-                            path=str(file_path),
+                            path=entry.path,
                             filename=filename,
                             match_text=filename,
-                            match_type='filename'
+                            match_type=MATCH_FILENAME
                         ))
                 else:
                     target = filename if case_sensitive else filename.lower()
-                    if fnmatch.fnmatch(target, f'*{pattern}*'):
+                    if glob_match(target):
                         matches.append(SearchMatch(
-                            path=str(file_path),
+                            path=entry.path,
                             filename=filename,
                             match_text=filename,
-                            match_type='filename'
+                            match_type=MATCH_FILENAME
                         ))
             except (PermissionError, OSError) as e:
-                errors.append(f"Error accessing {file_path}: {e}")
+                errors.append(f"Error accessing {entry.path}: {e}")
         
         elapsed = int((time.time() - start_time) * 1000)
         
@@ -282,6 +693,25 @@ class SearchEngine:
         Returns:
             SearchResult
         """
+        return self._search_content(search_path, pattern, is_regex, case_sensitive,
+                                    filters, context_lines, max_matches_per_file)
+    
+    def _search_content(self,
+                        search_path: Path,
+                        pattern: str,
+                        is_regex: bool,
+                        case_sensitive: bool,
+                        filters: Optional[SearchFilter],
+                        context_lines: int,
+                        max_matches_per_file: int,
+                        literals: Optional[Tuple[str, ...]] = None) -> SearchResult:
+        """
+        Implementation of search_content.
+        
+        literals, when given, lists keywords that every match must contain
+        as a whole word; files without any of them are skipped before the
+        regex runs.
+        """
         import time
         start_time = time.time()
         
@@ -290,13 +720,14 @@ class SearchEngine:
         errors: List[str] = []
         
         filters = filters or SearchFilter()
-        if not filters.exclude_dirs:
-            filters.exclude_dirs = self.DEFAULT_EXCLUDE_DIRS
+        exclude_dirs = filters.exclude_dirs or self.DEFAULT_EXCLUDE_DIRS
         
         # Compile pattern
-        flags = 0 if case_sensitive else re.IGNORECASE
+        # MULTILINE anchors ^ and $ to lines in the whole-text scan; DOTALL
+        # is left off so '.' cannot run past the end of a line
+        flags = (0 if case_sensitive else re.IGNORECASE) | re.MULTILINE
         try:
-            regex = re.compile(pattern, flags)
+            _compile_pattern(pattern, flags)
         except re.error as e:
             return SearchResult(
                 query=pattern,
@@ -307,49 +738,64 @@ class SearchEngine:
                 search_time_ms=0,
                 errors=[f"Invalid regex: {e}"]
             )
+        use_prefilter = (pattern.isascii() and
+                         _compile_prefilter(pattern.encode('ascii'), flags) is not None)
+        if use_prefilter or _compile_multi_literal(literals) is None:
+            literals = None
         
         # Collect files to search
         files_to_search = []
-        for file_path in search_path.rglob('*'):
-            if not file_path.is_file():
+        for entry, stat in self._iter_files(search_path, exclude_dirs):
+            # Skip binary and oversized files
+            if os.path.splitext(entry.name)[1].lower() in self.BINARY_EXTENSIONS:
                 continue
-            
-            # Skip binary files
-            if file_path.suffix.lower() in self.BINARY_EXTENSIONS:
+            if stat.st_size > self.max_file_size:
                 continue
             
-            try:
-                stat = file_path.stat()
-                if filters.matches(file_path, stat):
-                    files_to_search.append(file_path)
-            except (PermissionError, OSError):
-                pass
+            if filters.matches(entry, stat):
+                files_to_search.append(entry.path)
+        
+        # re holds the GIL while matching, so large pure-regex searches run
+        # in one worker process per CPU. The Hyperscan prefilter releases it
+        # and rejects most files cheaply, so it stays on threads, as does
+        # any search on a single CPU.
+        cpus = os.cpu_count() or 1
+        if (use_prefilter or cpus < 2 or
+                len(files_to_search) < self.PROCESS_POOL_MIN_FILES):
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        else:
+            executor = ProcessPoolExecutor(max_workers=cpus,
+                                           mp_context=_process_context())
         
         # Search in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with executor:
             futures = {
                 executor.submit(
-                    self._search_file_content,
-                    file_path,
-                    regex,
+                    _search_file_content,
+                    path_str,
+                    pattern,
+                    flags,
                     context_lines,
-                    max_matches_per_file
-                ): file_path
-                for file_path in files_to_search
+                    max_matches_per_file,
+                    use_prefilter,
+                    literals
+                ): path_str
+                for path_str in files_to_search
             }
             
             for future in as_completed(futures):
-                if self._cancel_flag:
+                if self._cancel.is_set():
+                    executor.shutdown(wait=False, cancel_futures=True)
                     break
                 
-                file_path = futures[future]
+                path_str = futures[future]
                 files_searched += 1
                 
                 try:
                     file_matches = future.result()
                     all_matches.extend(file_matches)
                 except Exception as e:
-                    errors.append(f"Error searching {file_path}: {e}")
+                    errors.append(f"Error searching {path_str}: {e}")
         
         elapsed = int((time.time() - start_time) * 1000)
         
@@ -364,50 +810,6 @@ class SearchEngine:
             errors=errors
         )
     
-    def _search_file_content(self,
-                             file_path: Path,
-                             regex: re.Pattern,
-                             context_lines: int,
-                             max_matches: int) -> List[SearchMatch]:
-        """Search content of a single file."""
-        matches = []
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            match_count = 0
-            for line_num, line in enumerate(lines, 1):
-                if match_count >= max_matches:
-                    break
-                
-                for match in regex.finditer(line):
-                    if match_count >= max_matches:
-                        break
-                    
-                    # Get context
-                    context = ''
-                    if context_lines > 0:
-                        start = max(0, line_num - 1 - context_lines)
-                        end = min(len(lines), line_num + context_lines)
-                        context_lines_list = lines[start:end]
-                        context = ''.join(context_lines_list).strip()
-                    
-                    matches.append(SearchMatch(
-                        path=str(file_path),
-                        filename=file_path.name,
-                        line_number=line_num,
-                        column=match.start() + 1,
-                        context=context or line.strip(),
-                        match_text=match.group(),
-                        match_type='content'
-                    ))
-                    match_count += 1
-        except Exception:
-            pass
-        
-        return matches
-    
     def search_todos(self, 
                      search_path: Path,
                      patterns: Optional[List[str]] = None,
@@ -426,14 +828,23 @@ class SearchEngine:
         if patterns is None:
             patterns = ['TODO', 'FIXME', 'HACK', 'XXX', 'BUG', 'OPTIMIZE']
         
-        pattern = r'\b(' + '|'.join(patterns) + r')\b[:\s]?.*'
+        # Keyword only; the matched line is reported as context
+        pattern = r'\b(?:' + '|'.join(patterns) + r')\b'
         
-        return self.search_content(
+        # Plain ASCII words can be prefiltered with Aho-Corasick
+        literals = None
+        if all(p.isascii() and p.isalpha() for p in patterns):
+            literals = tuple(patterns)
+        
+        return self._search_content(
             search_path,
             pattern,
             is_regex=True,
             case_sensitive=False,
-            filters=filters
+            filters=filters,
+            context_lines=0,
+            max_matches_per_file=100,
+            literals=literals
         )
     
     def find_large_files(self,
@@ -452,28 +863,25 @@ class SearchEngine:
             List of file info dicts
         """
         min_bytes = int(min_size_mb * 1024 * 1024)
-        large_files = []
         
-        for file_path in search_path.rglob('*'):
-            if not file_path.is_file():
-                continue
-            
-            try:
-                size = file_path.stat().st_size
-                if size >= min_bytes:
-                    large_files.append({
-                        'path': str(file_path),
-                        'filename': file_path.name,
-                        'size': size,
-                        'size_mb': round(size / (1024 * 1024), 2),
-                    })
-            except (PermissionError, OSError):
-                pass
-        
-        # Sort by size descending
-        large_files.sort(key=lambda x: x['size'], reverse=True)
-        
-        return large_files[:limit]
+        large = (
+            (stat.st_size, entry)
+            for entry, stat in self._iter_files(search_path)
+            if stat.st_size >= min_bytes
+        )
+        
+        # Keep the largest entries without sorting the whole tree
+        largest = heapq.nlargest(limit, large, key=itemgetter(0))
+        
+        return [
+            {
+                'path': entry.path,
+                'filename': entry.name,
+                'size': size,
+                'size_mb': round(size / (1024 * 1024), 2),
+            }
+            for size, entry in largest
+        ]
     
     def find_recently_modified(self,
                                search_path: Path,
@@ -490,30 +898,26 @@ class SearchEngine:
         Returns:
             List of file info dicts
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_files = []
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         
-        for file_path in search_path.rglob('*'):
-            if not file_path.is_file():
-                continue
-            
-            try:
-                stat = file_path.stat()
-                mtime = datetime.fromtimestamp(stat.st_mtime)
-                if mtime >= cutoff:
-                    recent_files.append({
-                        'path': str(file_path),
-                        'filename': file_path.name,
-                        'modified': mtime.isoformat(),
-                        'size': stat.st_size,
-                    })
-            except (PermissionError, OSError):
-                pass
-        
-        # Sort by modification time descending
-        recent_files.sort(key=lambda x: x['modified'], reverse=True)
-        
-        return recent_files[:limit]
+        recent = (
+            (stat.st_mtime, entry, stat)
+            for entry, stat in self._iter_files(search_path)
+            if stat.st_mtime >= cutoff_ts
+        )
+        
+        # Keep the newest entries; only those get formatted
+        newest = heapq.nlargest(limit, recent, key=itemgetter(0))
+        
+        return [
+            {
+                'path': entry.path,
+                'filename': entry.name,
+                'modified': datetime.fromtimestamp(mtime).isoformat(),
+                'size': stat.st_size,
+            }
+            for mtime, entry, stat in newest
+        ]
     
     def find_by_extension(self,
                           search_path: Path,
@@ -529,24 +933,109 @@ class SearchEngine:
             Dict mapping extension to file paths
         """
         result: Dict[str, List[str]] = {ext: [] for ext in extensions}
+        # Case-insensitive lookup into the caller's keys
+        buckets = {ext.lower(): result[ext] for ext in extensions}
         
-        for file_path in search_path.rglob('*'):
-            if not file_path.is_file():
+        for entry, _ in self._iter_files(search_path):
+            name = entry.name
+            dot = name.rfind('.')
+            if dot <= 0:
                 continue
-            
-            ext = file_path.suffix.lower()
-            if ext in extensions:
-                result[ext].append(str(file_path))
+            bucket = buckets.get(name[dot:].lower())
+            if bucket is not None:
+                bucket.append(entry.path)
         
         return result
     
+    def _iter_files(self,
+                    search_path: Path,
+                    exclude_dirs: Optional[Iterable[str]] = None
+                    ) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+        """
+        Walk a directory tree with os.scandir.
+        
+        Directories named in exclude_dirs are pruned before descending.
+        Entries that cannot be accessed are skipped. Cancellation is checked
+        once per directory.
+        
+        Args:
+            search_path: Root directory to walk
+            exclude_dirs: Directory names to skip
+            
+        Yields:
+            (DirEntry, stat_result) for every file
+        """
+        excluded = frozenset(exclude_dirs or ())
+        stack = [os.fspath(search_path)]
+        
+        cancelled = self._cancel.is_set
+        
+        while stack and not cancelled():
+            subdirs, files = self._scan_dir(stack.pop(), excluded)
+            stack.extend(subdirs)
+            yield from files
+    
+    def _iter_files_parallel(self,
+                             search_path: Path,
+                             exclude_dirs: Optional[Iterable[str]] = None
+                             ) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+        """
+        Walk a directory tree like _iter_files, listing directories in
+        parallel on max_workers threads.
+        
+        Files are yielded as each directory listing completes, so the
+        order is not deterministic.
+        """
+        excluded = frozenset(exclude_dirs or ())
+        cancelled = self._cancel.is_set
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._scan_dir, os.fspath(search_path), excluded)}
+            try:
+                while pending and not cancelled():
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        subdirs, files = future.result()
+                        pending.update(
+                            executor.submit(self._scan_dir, subdir, excluded)
+                            for subdir in subdirs
+                        )
+                        yield from files
+            finally:
+                # Consumer stopped early; drop listings not yet started
+                for future in pending:
+                    future.cancel()
+    
+    @staticmethod
+    def _scan_dir(directory: str, excluded: frozenset
+                  ) -> Tuple[List[str], List[Tuple[os.DirEntry, os.stat_result]]]:
+        """List one directory, returning (subdirectories, (entry, stat) per file)."""
+        subdirs = []
+        files = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in excluded:
+                                subdirs.append(entry.path)
+                        elif entry.is_file():
+                            files.append((entry, entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        
+        return subdirs, files
+    
     def cancel(self):
         """Cancel ongoing search."""
-        self._cancel_flag = True
+        self._cancel.set()
     
     def reset(self):
         """Reset cancel flag."""
-        self._cancel_flag = False
+        self._cancel.clear()
 
 
 # Singleton instance
@@ -6,19 +6,88 @@ Contains common utility functions used across the application.
 import os
 import sys
 import re
+import mmap
+import codecs
 import hashlib
 import mimetypes
 import stat
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union, Tuple, Generator
+from typing import Optional, List, Dict, Any, Union, Tuple, Generator, Pattern
 from datetime import datetime
 import json
 import fnmatch
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import chardet
+import atexit
+from functools import lru_cache, partial
+import multiprocessing
+import asyncio
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from chardet import UniversalDetector
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import liburing
+    LIBURING_AVAILABLE = True
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+# Comment regexes run on whole files, so prefer RE2's linear-time matcher.
+# Patterns use inline flags because re2.compile takes no flags argument.
+_compile_comment_re = re2.compile if RE2_AVAILABLE else re.compile
+_HASH_COMMENT_RE = _compile_comment_re(r'(?m)#.*$')
+_LINE_COMMENT_RE = _compile_comment_re(r'(?m)//.*$')
+_BLOCK_COMMENT_RE = _compile_comment_re(r'/\*[\s\S]*?\*/')
+
+# Language -> comment regexes applied in order by Utils.strip_comments
+_COMMENT_STRIPPERS = {
+    **dict.fromkeys(['python', 'py', 'shell', 'bash', 'sh', 'yaml', 'yml'],
+                    (_HASH_COMMENT_RE,)),
+    **dict.fromkeys(['javascript', 'js', 'typescript', 'ts', 'java', 'c', 'cpp', 'cs', 'go'],
+                    (_LINE_COMMENT_RE, _BLOCK_COMMENT_RE)),
+}
+
+# Line boundaries str.splitlines() honours besides '\n'
+_OTHER_LINE_BREAKS_RE = re.compile('[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+
+# Tree drawing characters before a name in Utils.parse_tree_string
+_TREE_PREFIX_RE = re.compile(r'^[├└│─\s]+')
+
+# Result of Utils.get_file_info
+FileInfo = namedtuple('FileInfo', 'size ctime mtime atime mode')
+
+
+def _call_safely(func, item: Any) -> Any:
+    """Call func(item), returning None if it raises (used by parallel_map)."""
+    try:
+        return func(item)
+    except Exception:
+        return None
+
+
+# Default algorithm for get_file_hash. 'blake3' is also accepted when the
+# blake3 package is installed and is much faster on large files.
+DEFAULT_HASH_ALG = 'sha256'
 
 
 class Utils:
@@ -27,6 +96,79 @@ class Utils:
     # Thread-local storage for caching
     _local = threading.local()
     
+    # Lower-case extension -> MIME type, built on first get_mime_type call
+    _mime_map: Optional[Dict[str, str]] = None
+    _mime_map_lock = threading.Lock()
+    
+    # Shared process pool for parallel_map(mode='cpu'), created on first use
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _process_pool_lock = threading.Lock()
+    
+    # Shared thread pool behind the async helpers, created on first use
+    _io_pool: Optional[ThreadPoolExecutor] = None
+    _io_pool_lock = threading.Lock()
+    
+    # Files up to this size are hashed through a single mmap;
+    # larger ones are read in HASH_CHUNK_SIZE blocks
+    HASH_MMAP_MAX_SIZE = 512 * 1024 * 1024
+    HASH_CHUNK_SIZE = 1024 * 1024
+    
+    # (mode bit, char) pairs for get_file_permissions, in rwxrwxrwx order
+    _PERMISSION_BITS = (
+        (stat.S_IRUSR, 'r'), (stat.S_IWUSR, 'w'), (stat.S_IXUSR, 'x'),
+        (stat.S_IRGRP, 'r'), (stat.S_IWGRP, 'w'), (stat.S_IXGRP, 'x'),
+        (stat.S_IROTH, 'r'), (stat.S_IWOTH, 'w'), (stat.S_IXOTH, 'x'),
+    )
+    
+    # Units for get_file_size_human, each 1024 times the previous
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+    
+    # Separators stripped from the end of a path before taking its name
+    _PATH_SEPARATORS = os.sep + (os.altsep or '')
+    
+    # Deletes the characters validate_structure rejects in names
+    _INVALID_NAME_TABLE = str.maketrans('', '', '<>:"|?*')
+    
+    # Maps the characters sanitize_filename replaces to '_'
+    _SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+    
+    # Bytes counted as text by is_binary_file
+    _TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100))))
+    
+    # Byte order marks, longest first so UTF-32 LE is not taken for UTF-16
+    _BOM_ENCODINGS = (
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+    
+    # Bytes fed to chardet per step while detecting an encoding
+    DETECT_CHUNK_SIZE = 1024
+    
+    # read_file_content decodes files this large straight from an mmap
+    READ_MMAP_MIN_SIZE = 1024 * 1024
+    
+    # Bytes per kernel-side copy call in copy_file
+    COPY_CHUNK_SIZE = 64 * 1024 * 1024
+    
+    # Reads submitted to io_uring at once by batch_read_heads
+    URING_QUEUE_DEPTH = 128
+    
+    # Direct constructors for common algorithms, skipping hashlib.new's
+    # name lookup; anything else still goes through hashlib.new
+    _HASH_CONSTRUCTORS = {
+        'md5': hashlib.md5,
+        'sha1': hashlib.sha1,
+        'sha256': hashlib.sha256,
+        'sha512': hashlib.sha512,
+        'blake2b': hashlib.blake2b,
+    }
+    
+    # BLAKE3 hashes on all cores from this size up
+    BLAKE3_THREADED_MIN_SIZE = 1024 * 1024
+    
     # =========================================================================
     # File System Utilities
     # =========================================================================
@@ -38,97 +180,294 @@ class Utils:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
+    @staticmethod
+    def get_file_info(filepath: Union[str, Path]) -> Optional[FileInfo]:
+        """
+        Get size, timestamps and mode of a file with a single stat call.
+        
+        Returns:
+            FileInfo, or None if the file cannot be accessed
+        """
+        try:
+            st = os.stat(os.fspath(filepath))
+        except OSError:
+            return None
+        return FileInfo(st.st_size, st.st_ctime, st.st_mtime, st.st_atime, st.st_mode)
+    
     @staticmethod
     def get_file_size(filepath: Union[str, Path]) -> int:
         """Get file size in bytes."""
         try:
-            return Path(filepath).stat().st_size
+            return os.stat(os.fspath(filepath)).st_size
         except OSError:
             return 0
     
     @staticmethod
     def get_file_size_human(size_bytes: int) -> str:
         """Convert bytes to human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        # Each unit is 2**10 times the last, so the bit length picks it
+        if size_bytes < 1024:
+            index = 0
+        else:
+            index = min((int(size_bytes).bit_length() - 1) // 10, len(Utils._SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * index)):.2f} {Utils._SIZE_UNITS[index]}"
     
     @staticmethod
     def get_file_dates(filepath: Union[str, Path]) -> Dict[str, datetime]:
         """Get creation and modification dates of a file."""
-        path = Path(filepath)
-        try:
-            stat_info = path.stat()
-            return {
-                'created': datetime.fromtimestamp(stat_info.st_ctime),
-                'modified': datetime.fromtimestamp(stat_info.st_mtime),
-                'accessed': datetime.fromtimestamp(stat_info.st_atime),
-            }
-        except OSError:
+        info = Utils.get_file_info(filepath)
+        if info is None:
             now = datetime.now()
             return {'created': now, 'modified': now, 'accessed': now}
+        return {
+            'created': datetime.fromtimestamp(info.ctime),
+            'modified': datetime.fromtimestamp(info.mtime),
+            'accessed': datetime.fromtimestamp(info.atime),
+        }
     
     @staticmethod
     def get_file_permissions(filepath: Union[str, Path]) -> str:
         """Get file permissions in Unix-style format."""
-        try:
-            mode = Path(filepath).stat().st_mode
-            perms = ''
-            for who in ['USR', 'GRP', 'OTH']:
-                for perm, char in [('R', 'r'), ('W', 'w'), ('X', 'x')]:
-                    if mode & getattr(stat, f'S_I{perm}{who}'):
-                        perms += char
-                    else:
-                        perms += '-'
-            return perms
-        except OSError:
+        info = Utils.get_file_info(filepath)
+        if info is None:
             return '---------'
+        mode = info.mode
+        return ''.join(char if mode & bit else '-' for bit, char in Utils._PERMISSION_BITS)
     
     @staticmethod
-    def get_file_hash(filepath: Union[str, Path], algorithm: str = 'sha256') -> str:
-        """Calculate hash of a file."""
-        hash_func = hashlib.new(algorithm)
+    def get_file_hash(filepath: Union[str, Path], algorithm: str = DEFAULT_HASH_ALG) -> str:
+        """
+        Calculate hash of a file.
+        
+        Args:
+            filepath: File to hash
+            algorithm: Any hashlib algorithm name, or 'blake3' when the
+                blake3 package is installed
+            
+        Returns:
+            Hex digest, or '' if the file cannot be read
+        """
+        if algorithm == 'blake3' and BLAKE3_AVAILABLE:
+            return Utils._blake3_file_hash(filepath)
+        
+        constructor = Utils._HASH_CONSTRUCTORS.get(algorithm)
+        hash_func = constructor() if constructor else hashlib.new(algorithm)
         try:
             with open(filepath, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hash_func.update(chunk)
+                size = os.fstat(f.fileno()).st_size
+                if 0 < size <= Utils.HASH_MMAP_MAX_SIZE:
+                    # One update call over the mapped file; hashlib
+                    # releases the GIL while digesting
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        hash_func.update(mm)
+                else:
+                    # Also covers size 0: procfs/sysfs files and FIFOs
+                    # report no size but still have content to read
+                    buf = bytearray(Utils.HASH_CHUNK_SIZE)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        hash_func.update(view[:n])
             return hash_func.hexdigest()
+        except (OSError, IOError, ValueError):
+            return ''
+    
+    @staticmethod
+    def _blake3_file_hash(filepath: Union[str, Path]) -> str:
+        """Hash a file with BLAKE3, multithreaded for large files."""
+        try:
+            path_str = os.fspath(filepath)
+            size = os.stat(path_str).st_size
+            threads = blake3.AUTO if size >= Utils.BLAKE3_THREADED_MIN_SIZE else 1
+            hasher = blake3(max_threads=threads)
+            if size:
+                hasher.update_mmap(path_str)
+            else:
+                # Size 0 can still mean content (procfs, sysfs, FIFOs)
+                with open(path_str, 'rb') as f:
+                    for chunk in iter(partial(f.read, Utils.HASH_CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+            return hasher.hexdigest()
         except (OSError, IOError):
             return ''
     
     @staticmethod
     def get_mime_type(filepath: Union[str, Path]) -> str:
         """Get MIME type of a file."""
-        mime_type, _ = mimetypes.guess_type(str(filepath))
+        ext = os.path.splitext(os.fspath(filepath))[1]
+        mime_type = Utils._get_mime_map().get(ext.lower())
+        if mime_type is None:
+            # Compound suffixes (.tar.gz, .tgz) and unknown extensions
+            mime_type, _ = mimetypes.guess_type(str(filepath))
         return mime_type or 'application/octet-stream'
     
+    @staticmethod
+    def _get_mime_map() -> Dict[str, str]:
+        """Snapshot mimetypes' extension table on first use."""
+        if Utils._mime_map is None:
+            with Utils._mime_map_lock:
+                if Utils._mime_map is None:
+                    mimetypes.init()
+                    # Leave out suffixes guess_type resolves through the
+                    # preceding extension, e.g. '.gz' in '.tar.gz'
+                    special = mimetypes.encodings_map.keys() | mimetypes.suffix_map.keys()
+                    Utils._mime_map = {
+                        ext.lower(): mime_type
+                        for ext, mime_type in mimetypes.types_map.items()
+                        if ext.lower() not in special
+                    }
+        return Utils._mime_map
+    
     @staticmethod
     def is_binary_file(filepath: Union[str, Path], chunk_size: int = 8192) -> bool:
         """Check if a file is binary by reading its content."""
-        try:
-            with open(filepath, 'rb') as f:
-                chunk = f.read(chunk_size)
-                if b'\x00' in chunk:
-                    return True
-                # Check for high ratio of non-printable characters
-                text_chars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)))
-                non_text = sum(1 for byte in chunk if byte not in text_chars)
-                return len(chunk) > 0 and (non_text / len(chunk)) > 0.30
-        except (OSError, IOError):
+        chunk = Utils._read_head(filepath, chunk_size)
+        return chunk is None or Utils._is_binary_chunk(chunk)
+    
+    @staticmethod
+    def is_binary_files(filepaths: List[Union[str, Path]],
+                        chunk_size: int = 8192) -> List[bool]:
+        """Check many files with is_binary_file, reading them as one batch."""
+        return [chunk is None or Utils._is_binary_chunk(chunk)
+                for chunk in Utils.batch_read_heads(filepaths, chunk_size)]
+    
+    @staticmethod
+    def _is_binary_chunk(chunk: bytes) -> bool:
+        """Check if the leading bytes of a file look binary."""
+        if b'\x00' in chunk:
             return True
+        # Check for high ratio of non-printable characters;
+        # deleting the text bytes leaves only the others
+        non_text = len(chunk.translate(None, Utils._TEXT_BYTES))
+        return len(chunk) > 0 and (non_text / len(chunk)) > 0.30
     
     @staticmethod
     def detect_encoding(filepath: Union[str, Path]) -> str:
         """Detect file encoding."""
+        raw = Utils._read_head(filepath, 10000)
+        return 'utf-8' if raw is None else Utils._encoding_from_bytes(raw)
+    
+    @staticmethod
+    def detect_encodings(filepaths: List[Union[str, Path]]) -> List[str]:
+        """Detect the encoding of many files, reading them as one batch."""
+        return ['utf-8' if raw is None else Utils._encoding_from_bytes(raw)
+                for raw in Utils.batch_read_heads(filepaths, 10000)]
+    
+    @staticmethod
+    def _encoding_from_bytes(raw: bytes) -> str:
+        """Detect the encoding of the leading bytes of a file."""
+        if not raw:
+            return 'utf-8'
+        
+        # BOMs and pure ASCII are decided without chardet
+        for bom, encoding in Utils._BOM_ENCODINGS:
+            if raw.startswith(bom):
+                return encoding
+        if raw.isascii():
+            return 'ascii'
+        
+        # Feed chardet in steps and stop once it is certain
+        detector = UniversalDetector()
+        step = Utils.DETECT_CHUNK_SIZE
+        for start in range(0, len(raw), step):
+            detector.feed(raw[start:start + step])
+            if detector.done:
+                break
+        result = detector.close()
+        return result.get('encoding', 'utf-8') or 'utf-8'
+    
+    @staticmethod
+    def _read_head(filepath: Union[str, Path], nbytes: int) -> Optional[bytes]:
+        """Read the first nbytes of a file, or None if it cannot be read."""
         try:
             with open(filepath, 'rb') as f:
-                raw = f.read(10000)
-                result = chardet.detect(raw)
-                return result.get('encoding', 'utf-8') or 'utf-8'
+                return f.read(nbytes)
         except (OSError, IOError):
-            return 'utf-8'
+            return None
+    
+    @staticmethod
+    def batch_read_heads(filepaths: List[Union[str, Path]],
+                         nbytes: int = 16384) -> List[Optional[bytes]]:
+        """
+        Read the first nbytes of many files.
+        
+        On Linux with liburing installed the reads are submitted to
+        io_uring in batches of URING_QUEUE_DEPTH; otherwise, or for a
+        single file, each file is read in turn.
+        
+        Args:
+            filepaths: Files to read
+            nbytes: Bytes to read from the start of each file
+            
+        Returns:
+            Leading bytes per file in input order; None if unreadable
+        """
+        paths = [os.fspath(p) for p in filepaths]
+        
+        if LIBURING_AVAILABLE and len(paths) > 1:
+            try:
+                return Utils._uring_read_heads(paths, nbytes)
+            except Exception:
+                # io_uring can be disabled by the kernel or a sandbox, and an
+                # incompatible binding must not cost correct results
+                pass
+        
+        return [Utils._read_head(p, nbytes) for p in paths]
+    
+    @staticmethod
+    def _uring_read_heads(paths: List[str], nbytes: int) -> List[Optional[bytes]]:
+        """io_uring implementation of batch_read_heads."""
+        results: List[Optional[bytes]] = [None] * len(paths)
+        depth = Utils.URING_QUEUE_DEPTH
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth, ring)
+        
+        try:
+            for start in range(0, len(paths), depth):
+                fds = []
+                buffers: Dict[int, bytearray] = {}
+                try:
+                    for index in range(start, min(start + depth, len(paths))):
+                        try:
+                            fd = os.open(paths[index], os.O_RDONLY)
+                        except OSError:
+                            continue
+                        fds.append(fd)
+                        buffers[index] = bytearray(nbytes)
+                        sqe = liburing.io_uring_get_sqe(ring)
+                        liburing.io_uring_prep_read(sqe, fd, buffers[index], nbytes, 0)
+                        liburing.io_uring_sqe_set_data64(sqe, index)
+                    
+                    if not buffers:
+                        continue
+                    
+                    # One submission for the whole batch, then reap
+                    liburing.io_uring_submit(ring)
+                    pending = len(buffers)
+                    while pending:
+                        liburing.io_uring_wait_cqe(ring, cqe)
+                        ready = liburing.io_uring_cq_ready(ring)
+                        for i in range(ready):
+                            entry = cqe[i]
+                            index, res = entry.user_data, entry.res
+                            if index not in buffers:
+                                raise RuntimeError(f"Unexpected io_uring completion: {index!r}")
+                            if res >= 0:
+                                results[index] = bytes(buffers[index][:res])
+                        liburing.io_uring_cq_advance(ring, ready)
+                        pending -= ready
+                finally:
+                    for fd in fds:
+                        os.close(fd)
+        finally:
+            liburing.io_uring_queue_exit(ring)
+        
+        return results
     
     @staticmethod
     def read_file_content(filepath: Union[str, Path], encoding: Optional[str] = None) -> Tuple[str, str]:
@@ -137,6 +476,18 @@ class Utils:
             encoding = Utils.detect_encoding(filepath)
         
         try:
+            with open(filepath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= Utils.READ_MMAP_MIN_SIZE:
+                    # Decode from the mapping instead of reading into an
+                    # intermediate bytes object, then translate newlines
+                    # as text mode would
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        content = str(mm, encoding, 'replace')
+                    return content.replace('\r\n', '\n').replace('\r', '\n'), encoding
+            
             with open(filepath, 'r', encoding=encoding, errors='replace') as f:
                 return f.read(), encoding
         except Exception:
@@ -163,11 +514,67 @@ class Utils:
         """Copy a file from source to destination."""
         try:
             Path(dst).parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
+            if not sys.platform.startswith('linux'):
+                shutil.copy2(src, dst)
+                return True
+            
+            # Same destination handling as shutil.copy2
+            if os.path.isdir(dst):
+                dst = os.path.join(dst, os.path.basename(src))
+            if os.path.exists(dst) and os.path.samefile(src, dst):
+                return False
+            with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+                Utils._copy_file_data(fsrc, fdst)
+            shutil.copystat(src, dst)
             return True
         except (OSError, IOError):
             return False
     
+    @staticmethod
+    def _copy_file_data(fsrc, fdst) -> None:
+        """
+        Copy file contents inside the kernel where possible.
+        
+        Tries copy_file_range (which can reflink on CoW filesystems), then
+        sendfile, then a buffered userspace copy, each resuming where the
+        previous one stopped. A kernel copy that ends before copying
+        anything falls through to the next method, since procfs and sysfs
+        files report no data to copy_file_range.
+        """
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        chunk = Utils.COPY_CHUNK_SIZE
+        offset = 0
+        
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while True:
+                    copied = os.copy_file_range(src_fd, dst_fd, chunk, offset, offset)
+                    if not copied:
+                        if offset:
+                            return
+                        break
+                    offset += copied
+            except OSError:
+                # e.g. EXDEV across filesystems on older kernels
+                pass
+        
+        if hasattr(os, 'sendfile'):
+            try:
+                os.lseek(dst_fd, offset, os.SEEK_SET)
+                while True:
+                    copied = os.sendfile(dst_fd, src_fd, offset, chunk)
+                    if not copied:
+                        if offset:
+                            return
+                        break
+                    offset += copied
+            except OSError:
+                pass
+        
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    
     @staticmethod
     def safe_delete(path: Union[str, Path]) -> bool:
         """Safely delete a file or directory."""
@@ -200,7 +607,7 @@ class Utils:
     @staticmethod
     def normalize_path(path: Union[str, Path]) -> Path:
         """Normalize a path to absolute form."""
-        return Path(path).resolve()
+        return Path(os.path.realpath(os.fspath(path)))
     
     @staticmethod
     def get_relative_path(path: Union[str, Path], base: Union[str, Path]) -> str:
@@ -222,25 +629,42 @@ class Utils:
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Remove invalid characters from filename."""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        return filename.strip('. ')
+        return filename.translate(Utils._SANITIZE_TABLE).strip('. ')
     
     @staticmethod
     def get_extension(filepath: Union[str, Path]) -> str:
         """Get file extension in lowercase."""
-        return Path(filepath).suffix.lower()
+        return Utils._split_name(filepath)[1].lower()
     
     @staticmethod
     def get_basename(filepath: Union[str, Path]) -> str:
         """Get filename without path."""
-        return Path(filepath).name
+        return Utils._name(filepath)
     
     @staticmethod
     def get_stem(filepath: Union[str, Path]) -> str:
         """Get filename without extension."""
-        return Path(filepath).stem
+        return Utils._split_name(filepath)[0]
+    
+    @staticmethod
+    def _name(filepath: Union[str, Path]) -> str:
+        """Final path component, as Path.name gives it, without a Path object."""
+        path_str = os.fspath(filepath).rstrip(Utils._PATH_SEPARATORS)
+        name = os.path.basename(path_str)
+        if name == '.':
+            # Path drops '.' components
+            return Utils._name(os.path.dirname(path_str))
+        return name
+    
+    @staticmethod
+    def _split_name(filepath: Union[str, Path]) -> Tuple[str, str]:
+        """(stem, suffix) of the final component, as Path.stem/suffix give them."""
+        name = Utils._name(filepath)
+        stem, suffix = os.path.splitext(name)
+        # Path treats a trailing dot as part of the stem
+        if suffix == '.':
+            return name, ''
+        return stem, suffix
     
     # =========================================================================
     # Pattern Matching Utilities
@@ -262,21 +686,57 @@ class Utils:
     @staticmethod
     def matches_any_pattern(path: str, patterns: List[str]) -> bool:
         """Check if path matches any of the patterns."""
-        return any(Utils.matches_pattern(path, p) for p in patterns)
+        dir_regex, file_regex = Utils.compile_patterns(tuple(patterns))
+        
+        if dir_regex is not None:
+            path_parts = path.replace('\\', '/').split('/')
+            if any(dir_regex.match(os.path.normcase(part)) for part in path_parts):
+                return True
+        
+        if file_regex is not None:
+            return bool(file_regex.match(os.path.normcase(path)) or
+                        file_regex.match(os.path.normcase(Utils._name(path))))
+        
+        return False
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def compile_patterns(patterns: Tuple[str, ...]
+                         ) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+        """
+        Compile glob patterns into one regex per pattern kind.
+        
+        Args:
+            patterns: Glob patterns; a trailing '/' marks a directory
+                pattern, matched against each path component
+            
+        Returns:
+            (directory regex, file regex); either is None if there are
+            no patterns of that kind
+        """
+        dir_patterns = []
+        file_patterns = []
+        
+        for pattern in patterns:
+            if pattern.endswith('/'):
+                dir_patterns.append(fnmatch.translate(os.path.normcase(pattern[:-1])))
+            else:
+                file_patterns.append(fnmatch.translate(os.path.normcase(pattern)))
+        
+        dir_regex = re.compile('|'.join(dir_patterns)) if dir_patterns else None
+        file_regex = re.compile('|'.join(file_patterns)) if file_patterns else None
+        return dir_regex, file_regex
     
     @staticmethod
     def load_ignore_patterns(ignore_file: Union[str, Path]) -> List[str]:
         """Load patterns from an ignore file."""
-        patterns = []
         try:
             with open(ignore_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        patterns.append(line)
+                lines = f.read().splitlines()
         except (OSError, IOError):
-            pass
-        return patterns
+            return []
+        return [line for line in map(str.strip, lines)
+                if line and not line.startswith('#')]
     
     # =========================================================================
     # JSON/YAML Utilities
@@ -285,8 +745,8 @@ class Utils:
     @staticmethod
     def load_json(filepath: Union[str, Path]) -> Dict[str, Any]:
         """Load JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return Utils._loads(f.read())
     
     @staticmethod
     def save_json(filepath: Union[str, Path], data: Dict[str, Any], 
@@ -294,6 +754,12 @@ class Utils:
         """Save data to JSON file."""
         try:
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+            encoded = Utils._orjson_dumps(data, indent)
+            if encoded is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(encoded)
+                return True
+            
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
             return True
@@ -303,12 +769,47 @@ class Utils:
     @staticmethod
     def to_json(data: Any, indent: int = 2) -> str:
         """Convert data to JSON string."""
+        encoded = Utils._orjson_dumps(data, indent)
+        if encoded is not None:
+            return encoded.decode('utf-8')
         return json.dumps(data, indent=indent, ensure_ascii=False, default=str)
     
     @staticmethod
     def from_json(json_str: str) -> Any:
         """Parse JSON string."""
-        return json.loads(json_str)
+        return Utils._loads(json_str)
+    
+    @staticmethod
+    def _orjson_dumps(data: Any, indent: Optional[int]) -> Optional[bytes]:
+        """
+        Serialize with orjson the way the json module calls here would.
+        
+        Returns None when orjson is not installed, cannot produce the
+        requested indent, or rejects the data; callers then use json.
+        """
+        # orjson only indents by two, and its compact form drops the
+        # spaces json puts after separators
+        if not ORJSON_AVAILABLE or indent != 2:
+            return None
+        
+        # Datetimes and dataclasses go through default=str, as with json
+        option = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                  orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except orjson.JSONEncodeError:
+            return None
+    
+    @staticmethod
+    def _loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON with orjson when installed, else json."""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # json also accepts NaN/Infinity; let it decide
+                pass
+        return json.loads(data)
     
     # =========================================================================
     # String Utilities
@@ -324,25 +825,32 @@ class Utils:
     @staticmethod
     def count_lines(text: str) -> int:
         """Count number of lines in text."""
-        return len(text.splitlines())
+        if not text:
+            return 0
+        # Only '\n' breaks can be counted without building the line list
+        if _OTHER_LINE_BREAKS_RE.search(text):
+            return len(text.splitlines())
+        return text.count('\n') + (not text.endswith('\n'))
     
     @staticmethod
     def indent_text(text: str, spaces: int = 2) -> str:
         """Indent each line of text."""
         indent = ' ' * spaces
-        return '\n'.join(indent + line for line in text.splitlines())
+        if not text:
+            return ''
+        if _OTHER_LINE_BREAKS_RE.search(text):
+            return '\n'.join(indent + line for line in text.splitlines())
+        # Like splitlines, a final newline does not start another line
+        if text.endswith('\n'):
+            text = text[:-1]
+        return indent + text.replace('\n', '\n' + indent)
     
     @staticmethod
     def strip_comments(code: str, language: str) -> str:
         """Strip comments from code (basic implementation)."""
-        if language in ['python', 'py', 'shell', 'bash', 'sh', 'yaml', 'yml']:
-            # Remove # comments
-            return re.sub(r'#.*$', '', code, flags=re.MULTILINE)
-        elif language in ['javascript', 'js', 'typescript', 'ts', 'java', 'c', 'cpp', 'cs', 'go']:
-            # Remove // and /* */ comments
-            code = re.sub(r'//.*$', '', code, flags=re.MULTILINE)
-            code = re.sub(r'/\*[\s\S]*?\*/', '', code)
-            return code
+        # '#' comments, or '//' then '/* */' comments, by language
+        for regex in _COMMENT_STRIPPERS.get(language, ()):
+            code = regex.sub('', code)
         return code
     
     # =========================================================================
@@ -353,19 +861,24 @@ class Utils:
     def build_tree_string(structure: Dict[str, Any], prefix: str = '', 
                          is_last: bool = True) -> str:
         """Build a tree-like string representation of structure."""
-        lines = []
-        items = list(structure.items())
+        lines: List[str] = []
+        # (prefix, items, next index) for each directory being listed
+        stack = [(prefix, list(structure.items()), 0)]
         
-        for i, (name, content) in enumerate(items):
+        while stack:
+            prefix, items, i = stack.pop()
+            if i >= len(items):
+                continue
+            stack.append((prefix, items, i + 1))
+            
+            name, content = items[i]
             is_last_item = (i == len(items) - 1)
             connector = '└── ' if is_last_item else '├── '
             lines.append(f"{prefix}{connector}{name}")
             
             if isinstance(content, dict) and content:
                 extension = '    ' if is_last_item else '│   '
-                lines.append(Utils.build_tree_string(
-                    content, prefix + extension, is_last_item
-                ))
+                stack.append((prefix + extension, list(content.items()), 0))
         
         return '\n'.join(lines)
     
@@ -374,18 +887,16 @@ class Utils:
         """Parse a tree-like string into a structure dictionary."""
         lines = tree_str.strip().split('\n')
         root: Dict[str, Any] = {}
-        stack: List[Tuple[int, Dict[str, Any]]] = [(0, root)]
+        # The root sits below any indent, so the stack never empties
+        stack: List[Tuple[int, Dict[str, Any]]] = [(-1, root)]
         
         for line in lines:
-            if not line.strip():
-                continue
-            
-            # Calculate depth based on indentation
-            stripped = line.lstrip()
-            indent = len(line) - len(stripped)
+            # One match finds both the depth and the start of the name;
+            # tree characters count towards the indent like spaces
+            prefix = _TREE_PREFIX_RE.match(line)
+            indent = prefix.end() if prefix else 0
             
-            # Remove tree characters
-            name = re.sub(r'^[├└│─\s]+', '', stripped).strip()
+            name = line[indent:].strip()
             if not name:
                 continue
             
@@ -395,12 +906,9 @@ class Utils:
                 name = name[:-1]
             
             # Find parent level
-            while stack and stack[-1][0] >= indent:
+            while stack[-1][0] >= indent:
                 stack.pop()
             
-            if not stack:
-                stack = [(0, root)]
-            
             parent = stack[-1][1]
             
             if is_dir:
@@ -417,23 +925,122 @@ class Utils:
     
     @staticmethod
     def parallel_map(func, items: List[Any], max_workers: Optional[int] = None,
-                    show_progress: bool = False) -> List[Any]:
-        """Execute function on items in parallel."""
-        results = []
+                    show_progress: bool = False, mode: str = 'io') -> List[Any]:
+        """
+        Execute function on items in parallel.
+        
+        Args:
+            func: Function to call on each item
+            items: Items to process
+            max_workers: Number of threads (mode='io') or the batching
+                hint for the shared process pool (mode='cpu')
+            show_progress: Show a tqdm progress bar, if tqdm is installed
+            mode: 'io' runs on threads; 'cpu' runs on a shared process pool
+                sized to the CPU count, so func and items must be picklable
+            
+        Returns:
+            Results in item order; None where func raised
+        """
+        items = list(items)
+        if not items:
+            return []
         max_workers = max_workers or os.cpu_count() or 4
+        call = partial(_call_safely, func)
+        
+        if mode == 'cpu':
+            executor = Utils._get_process_pool()
+            # Batch items to cut IPC round-trips while leaving several
+            # batches per worker for load balancing
+            chunksize = max(1, len(items) // (4 * max_workers))
+            results = executor.map(call, items, chunksize=chunksize)
+            return list(Utils._with_progress(results, len(items), show_progress))
+        
+        # No more threads than items
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            results = executor.map(call, items)
+            return list(Utils._with_progress(results, len(items), show_progress))
+    
+    @staticmethod
+    def _with_progress(results, total: int, show_progress: bool):
+        """Wrap results in a tqdm progress bar when requested and available."""
+        if not show_progress:
+            return results
+        try:
+            from tqdm import tqdm
+        except ImportError:
+            return results
+        return tqdm(results, total=total)
+    
+    @staticmethod
+    def _get_process_pool() -> ProcessPoolExecutor:
+        """Get the shared process pool, creating it on first use."""
+        with Utils._process_pool_lock:
+            if Utils._process_pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context(
+                    'forkserver' if 'forkserver' in methods else None
+                )
+                Utils._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(), mp_context=context
+                )
+                atexit.register(Utils._process_pool.shutdown)
+            return Utils._process_pool
+    
+    # =========================================================================
+    # Async Utilities
+    # =========================================================================
+    
+    @staticmethod
+    def _get_io_pool() -> ThreadPoolExecutor:
+        """Get the shared thread pool for async file I/O, creating it on first use."""
+        with Utils._io_pool_lock:
+            if Utils._io_pool is None:
+                Utils._io_pool = ThreadPoolExecutor(
+                    max_workers=min(64, 4 * (os.cpu_count() or 1)),
+                    thread_name_prefix='utils-io',
+                )
+                atexit.register(Utils._io_pool.shutdown)
+            return Utils._io_pool
+    
+    @staticmethod
+    async def _run_io(func, *args) -> Any:
+        """Run a blocking call on the shared I/O pool from a coroutine."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(Utils._get_io_pool(), partial(func, *args))
+    
+    @staticmethod
+    async def a_read_content(filepath: Union[str, Path],
+                             encoding: Optional[str] = None) -> Tuple[str, str]:
+        """Async read_file_content, run on the shared I/O pool."""
+        return await Utils._run_io(Utils.read_file_content, filepath, encoding)
+    
+    @staticmethod
+    async def a_hash(filepath: Union[str, Path], algorithm: str = DEFAULT_HASH_ALG) -> str:
+        """Async get_file_hash, run on the shared I/O pool."""
+        return await Utils._run_io(Utils.get_file_hash, filepath, algorithm)
+    
+    @staticmethod
+    async def gather_hashes(filepaths: List[Union[str, Path]],
+                            algorithm: str = DEFAULT_HASH_ALG,
+                            concurrency: int = 32) -> List[str]:
+        """
+        Hash many files concurrently.
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(func, item): i for i, item in enumerate(items)}
-            results = [None] * len(items)
+        Args:
+            filepaths: Files to hash
+            algorithm: Hash algorithm, as for get_file_hash
+            concurrency: Most files open at once
             
-            for future in as_completed(futures):
-                idx = futures[future]
-                try:
-                    results[idx] = future.result()
-                except Exception as e:
-                    results[idx] = None
+        Returns:
+            Hashes in filepaths order; '' where a file could not be read
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
         
-        return results
+        async def hash_one(filepath):
+            async with semaphore:
+                return await Utils.a_hash(filepath, algorithm)
+        
+        return await asyncio.gather(*(hash_one(p) for p in filepaths))
     
     # =========================================================================
     # Date/Time Utilities
@@ -467,14 +1074,59 @@ class Utils:
         except ImportError:
             # Fallback for Windows
             if sys.platform == 'win32':
-                import subprocess
-                result = subprocess.run(['powershell', '-command', 
-                                       'Get-Clipboard'], capture_output=True, text=True)
-                return result.stdout
+                return Utils._get_clipboard_win32()
         except Exception:
             pass
         return ''
     
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _win32_clipboard_api() -> Tuple[Any, Any]:
+        """Load user32/kernel32 and declare the clipboard function signatures once."""
+        import ctypes
+        from ctypes import wintypes
+        
+        user32 = ctypes.WinDLL('user32', use_last_error=True)
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        
+        user32.OpenClipboard.argtypes = [wintypes.HWND]
+        user32.OpenClipboard.restype = wintypes.BOOL
+        user32.GetClipboardData.argtypes = [wintypes.UINT]
+        user32.GetClipboardData.restype = wintypes.HANDLE
+        user32.CloseClipboard.restype = wintypes.BOOL
+        kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalLock.restype = wintypes.LPVOID
+        kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalUnlock.restype = wintypes.BOOL
+        
+        return user32, kernel32
+    
+    @staticmethod
+    def _get_clipboard_win32() -> str:
+        """Read Unicode text from the Windows clipboard through the Win32 API."""
+        import ctypes
+        CF_UNICODETEXT = 13
+        
+        try:
+            user32, kernel32 = Utils._win32_clipboard_api()
+            if not user32.OpenClipboard(None):
+                return ''
+            try:
+                handle = user32.GetClipboardData(CF_UNICODETEXT)
+                if not handle:
+                    return ''
+                data = kernel32.GlobalLock(handle)
+                if not data:
+                    return ''
+                try:
+                    return ctypes.wstring_at(data)
+                finally:
+                    kernel32.GlobalUnlock(handle)
+            finally:
+                user32.CloseClipboard()
+        except (OSError, AttributeError):
+            return ''
+    
     @staticmethod
     def set_clipboard_content(content: str) -> bool:
         """Set content to clipboard."""
@@ -513,20 +1165,26 @@ class Utils:
     def validate_structure(structure: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Validate a structure dictionary."""
         errors = []
+        table = Utils._INVALID_NAME_TABLE
+        # (path, remaining items) for each directory being walked
+        stack = [('', iter(structure.items()))]
         
-        def validate_recursive(struct: Dict[str, Any], path: str = ''):
-            for name, content in struct.items():
+        while stack:
+            path, items = stack[-1]
+            for name, content in items:
                 current_path = f"{path}/{name}" if path else name
                 
                 # Check for valid name
-                if not name or any(c in name for c in '<>:"|?*'):
+                if not name or len(name.translate(table)) != len(name):
                     errors.append(f"Invalid name: {current_path}")
                 
-                # Recursively validate directories
+                # Descend into directories before the remaining siblings
                 if isinstance(content, dict):
-                    validate_recursive(content, current_path)
+                    stack.append((current_path, iter(content.items())))
+                    break
+            else:
+                stack.pop()
         
-        validate_recursive(structure)
         return len(errors) == 0, errors
 
 
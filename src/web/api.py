@@ -4,49 +4,222 @@ REST API using FastAPI for remote access.
 """
 
 import os
-import sys
+import stat
+import time
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import json
-import tempfile
+import hashlib
+from functools import partial, lru_cache
+from itertools import islice
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.config import ExportFormat
 
 try:
-    from fastapi import FastAPI, HTTPException, Query, UploadFile, File, BackgroundTasks
+    from fastapi import FastAPI, Depends, HTTPException, Query, Request, UploadFile, File, BackgroundTasks
+    from fastapi.exceptions import RequestValidationError
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
-    from pydantic import BaseModel
+    from fastapi.responses import Response, StreamingResponse
+    from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+    from anyio import to_thread
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
 
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Worker threads shared by the blocking scan/build/analyze calls
+THREAD_POOL_SIZE = 100
+
+# Export format query values accepted by /api/extract/export
+_FORMAT_MAP = {
+    'json': ExportFormat.JSON,
+    'txt': ExportFormat.TXT,
+    'md': ExportFormat.MARKDOWN,
+    'yaml': ExportFormat.YAML,
+    'html': ExportFormat.HTML,
+}
+
+# Download file extension per export format; never taken from the request
+_FORMAT_EXTENSIONS = {fmt: ext for ext, fmt in _FORMAT_MAP.items()}
+
+# Bytes of NDJSON gathered before a streamed scan sends a chunk
+NDJSON_CHUNK_SIZE = 16 * 1024
+
+# Largest page a list endpoint returns per request
+MAX_PAGE_SIZE = 1000
+
+# Seconds a cached scan/analysis result is served for, and how many are kept
+RESULT_CACHE_TTL = 30
+RESULT_CACHE_SIZE = 128
+
+# (kind, path, params, fingerprint) -> (stored at, result), least recent first
+_result_cache: 'OrderedDict[tuple, Tuple[float, Any]]' = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+# Parse results are pure in (content, format), so they are kept by content
+# hash without a TTL; least recently used first
+PARSE_CACHE_SIZE = 512
+_parse_cache: 'OrderedDict[Tuple[bytes, Optional[str]], Any]' = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _dir_fingerprint(path: Path) -> tuple:
+    """
+    Cheap change marker for a path: its own mtime plus the number and
+    newest mtime of its direct children. Deeper edits are only picked up
+    once RESULT_CACHE_TTL expires.
+    """
+    st = path.stat()
+    if not stat.S_ISDIR(st.st_mode):
+        return (st.st_mtime_ns, st.st_size)
+    count = 0
+    newest = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            count += 1
+            try:
+                newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+            except OSError:
+                pass
+    return (st.st_mtime_ns, count, newest)
+
+
+def _cache_get(key: tuple) -> Optional[Any]:
+    """Return a cached result that is still within RESULT_CACHE_TTL."""
+    with _result_cache_lock:
+        hit = _result_cache.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] > RESULT_CACHE_TTL:
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+        return hit[1]
+
+
+def _cache_put(key: tuple, result: Any) -> None:
+    """Store a result, evicting the least recently used beyond RESULT_CACHE_SIZE."""
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic(), result)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
 
 # Models
 class ScanRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     path: str
     recursive: bool = True
     include_hidden: bool = False
+    no_cache: bool = False
 
 
 class BuildRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     structure: Dict[str, Any]
     output_path: str
     force: bool = False
     dry_run: bool = False
 
 
+class BuildRequestMeta(BaseModel):
+    """The scalar fields of BuildRequest, validated without the structure."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    output_path: str
+    force: bool = False
+    dry_run: bool = False
+
+
+_BUILD_META_ADAPTER = TypeAdapter(BuildRequestMeta)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON values module results may carry."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response that serializes handler results as they are.
+    
+    Handlers return these directly so FastAPI skips its jsonable_encoder
+    pass over large result dicts; orjson is used when installed.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _parse_build_body(body: bytes) -> Tuple[Dict[str, Any], BuildRequestMeta]:
+    """
+    Split a /api/build body into its structure and validated scalar fields.
+    
+    The structure is used as decoded, not walked by pydantic.
+    
+    Raises:
+        RequestValidationError: On malformed JSON or invalid fields
+    """
+    try:
+        payload = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+    except ValueError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid", "loc": ("body",), "msg": f"Invalid JSON: {e}", "input": None,
+        }])
+    if not isinstance(payload, dict):
+        raise RequestValidationError([{
+            "type": "dict_type", "loc": ("body",), "msg": "Input should be an object", "input": None,
+        }])
+    
+    structure = payload.pop("structure", None)
+    if not isinstance(structure, dict):
+        raise RequestValidationError([{
+            "type": "dict_type", "loc": ("body", "structure"),
+            "msg": "Input should be a valid dictionary", "input": structure,
+        }])
+    try:
+        meta = _BUILD_META_ADAPTER.validate_python(payload)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+    return structure, meta
+
+
 class ExtractRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     path: str
     format: str = "json"
     include_content: bool = False
     encrypt: bool = False
     password: Optional[str] = None
+    no_cache: bool = False
 
 
 class SearchRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     path: str
     pattern: str
     is_regex: bool = True
@@ -55,10 +228,211 @@ class SearchRequest(BaseModel):
 
 
 class CompareRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     old_path: str
     new_path: str
 
 
+def _resolve(path: str, label: str = "Path") -> Path:
+    """Return path as a Path, or raise a 404 if it does not exist (one stat call)."""
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail=f"{label} not found: {path}")
+    return Path(path)
+
+
+async def _parse_cached(parser, content: str, format: Optional[str]):
+    """parser.parse, reusing the result for content already parsed in this format."""
+    key = (hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest(), format)
+    with _parse_cache_lock:
+        if key in _parse_cache:
+            _parse_cache.move_to_end(key)
+            return _parse_cache[key]
+    result = await _run_blocking(parser.parse, content, format)
+    with _parse_cache_lock:
+        _parse_cache[key] = result
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return result
+
+
+def _page(items: List[Any], offset: int, limit: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Serialize one page of items.
+    
+    Returns:
+        (to_dict() of items[offset:offset + limit],
+         {"total": len(items), "next_offset": start of the next page or None})
+    """
+    page = [item.to_dict() for item in islice(items, offset, offset + limit)]
+    end = offset + len(page)
+    return page, {"total": len(items), "next_offset": end if end < len(items) else None}
+
+
+def _ndjson_chunks(entries) -> Any:
+    """Encode (relative_path, meta) scan entries as NDJSON byte chunks."""
+    buffer = []
+    size = 0
+    for relative_path, meta in entries:
+        record = {"path": relative_path, **meta}
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(record) + b"\n"
+        else:
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        buffer.append(line)
+        size += len(line)
+        if size >= NDJSON_CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+# ==================== PROVIDERS ====================
+# Each module is imported and constructed on first use, then shared.
+
+@lru_cache(maxsize=1)
+def get_scanner():
+    from src.modules.scanner import ProjectScanner
+    return ProjectScanner()
+
+
+@lru_cache(maxsize=1)
+def get_parser():
+    from src.modules.parser import StructureParser
+    return StructureParser()
+
+
+@lru_cache(maxsize=1)
+def get_builder():
+    from src.modules.builder import StructureBuilder
+    return StructureBuilder()
+
+
+@lru_cache(maxsize=1)
+def get_exporter():
+    from src.modules.exporter import Exporter
+    return Exporter()
+
+
+@lru_cache(maxsize=1)
+def get_extractor():
+    from src.modules.content_extractor import ContentExtractor
+    return ContentExtractor()
+
+
+@lru_cache(maxsize=1)
+def get_diff():
+    from src.modules.diff_compare import DiffCompare
+    return DiffCompare()
+
+
+@lru_cache(maxsize=1)
+def get_analyzer():
+    from src.modules.file_analyzer import FileAnalyzer
+    return FileAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def get_search():
+    from src.search.search_engine import SearchEngine
+    return SearchEngine()
+
+
+@lru_cache(maxsize=1)
+def get_stats():
+    from src.analytics.statistics import ProjectStatistics
+    return ProjectStatistics()
+
+
+_PROVIDERS = (
+    get_scanner, get_parser, get_builder, get_exporter, get_extractor,
+    get_diff, get_analyzer, get_search, get_stats,
+)
+
+
+def _warm_providers() -> None:
+    """Import and construct every module so no request pays for it."""
+    for provider in _PROVIDERS:
+        provider()
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking module call in the worker thread pool."""
+    return await to_thread.run_sync(partial(func, *args, **kwargs))
+
+
+def _call_cached(kind: str, target: Path, params: tuple, no_cache: bool,
+                 func, *args, **kwargs):
+    """
+    Call func, reusing a recent result for the same unchanged path.
+    Results with success == False are never cached. Blocking: resolving
+    and fingerprinting the path touch the filesystem.
+    """
+    key = (kind, str(target.resolve()), params, _dir_fingerprint(target))
+    if not no_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+    result = func(*args, **kwargs)
+    if getattr(result, 'success', True):
+        _cache_put(key, result)
+    return result
+
+
+async def _run_cached(kind: str, target: Path, params: tuple, no_cache: bool,
+                      func, *args, **kwargs):
+    """_call_cached in the worker thread pool, keeping the event loop free."""
+    return await _run_blocking(_call_cached, kind, target, params, no_cache,
+                               func, *args, **kwargs)
+
+
+async def _scan_cached(scanner, target: Path, recursive: bool = True,
+                       include_hidden: bool = False, no_cache: bool = False):
+    """Cached scanner.scan."""
+    return await _run_cached(
+        'scan', target, (recursive, include_hidden), no_cache,
+        scanner.scan, target, recursive=recursive, include_hidden=include_hidden
+    )
+
+
+async def _stream_scan(scanner, target: Path, recursive: bool, include_hidden: bool):
+    """Stream scanner.iter_scan entries as NDJSON, one line per file or directory."""
+    try:
+        entries = await _run_blocking(
+            scanner.iter_scan, target, recursive=recursive, include_hidden=include_hidden
+        )
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=[str(e)])
+    return StreamingResponse(_ndjson_chunks(entries), media_type="application/x-ndjson")
+
+
+async def _do_scan(scanner, path: str, recursive: bool, include_hidden: bool,
+                   no_cache: bool, stream: Optional[str]):
+    """Shared body of the POST and GET scan routes."""
+    target = _resolve(path)
+    
+    if stream:
+        return await _stream_scan(scanner, target, recursive, include_hidden)
+    
+    result = await _scan_cached(
+        scanner, target, recursive=recursive, include_hidden=include_hidden, no_cache=no_cache
+    )
+    
+    if not result.success:
+        raise HTTPException(status_code=500, detail=result.errors)
+    
+    return FastJSONResponse({
+        "success": True,
+        "project_type": result.project_type.name,
+        "structure": result.structure,
+        "stats": result.stats,
+    })
+
+
 def create_app() -> 'FastAPI':
     """Create and configure FastAPI application."""
     if not FASTAPI_AVAILABLE:
@@ -70,6 +444,7 @@ def create_app() -> 'FastAPI':
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=FastJSONResponse,
     )
     
     # CORS middleware
@@ -81,34 +456,24 @@ def create_app() -> 'FastAPI':
         allow_headers=["*"],
     )
     
-    # Import modules lazily
-    from src.modules.scanner import ProjectScanner
-    from src.modules.parser import StructureParser
-    from src.modules.builder import StructureBuilder
-    from src.modules.exporter import Exporter
-    from src.modules.content_extractor import ContentExtractor
-    from src.modules.diff_compare import DiffCompare
-    from src.modules.file_analyzer import FileAnalyzer
-    from src.search.search_engine import SearchEngine
-    from src.analytics.statistics import ProjectStatistics
-    from src.config import ExportFormat
-    
-    scanner = ProjectScanner()
-    parser = StructureParser()
-    builder = StructureBuilder()
-    exporter = Exporter()
-    extractor = ContentExtractor()
-    diff = DiffCompare()
-    analyzer = FileAnalyzer()
-    search = SearchEngine()
-    stats = ProjectStatistics()
+    @app.on_event("startup")
+    async def configure_thread_pool():
+        """Let enough blocking calls run at once for concurrent requests."""
+        to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    
+    @app.on_event("startup")
+    async def warm_up_modules():
+        """Load the modules off the event loop before the first request."""
+        # One thread, in order: parallel first calls could race the
+        # providers' caches and contend on shared import locks
+        await to_thread.run_sync(_warm_providers)
     
     # ==================== ROUTES ====================
     
     @app.get("/")
     async def root():
         """API root endpoint."""
-        return {
+        return FastJSONResponse({
             "name": "Stracture-Master API",
             "version": "1.0.0",
             "endpoints": {
@@ -121,262 +486,253 @@ def create_app() -> 'FastAPI':
                 "analyze": "/api/analyze",
                 "statistics": "/api/statistics",
             }
-        }
+        })
     
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+        return FastJSONResponse({"status": "healthy", "timestamp": datetime.now()})
     
     # ==================== SCAN ====================
     
     @app.post("/api/scan")
-    async def scan_project(request: ScanRequest):
-        """Scan a project and extract its structure."""
-        path = Path(request.path)
-        
-        if not path.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {request.path}")
-        
-        result = scanner.scan(
-            path,
-            recursive=request.recursive,
-            include_hidden=request.include_hidden
+    async def scan_project(request: ScanRequest,
+                           stream: Optional[str] = Query(None, pattern="^ndjson$"),
+                           scanner=Depends(get_scanner)):
+        """Scan a project and extract its structure; ?stream=ndjson streams entries."""
+        return await _do_scan(
+            scanner, request.path, request.recursive, request.include_hidden,
+            request.no_cache, stream
         )
-        
-        if not result.success:
-            raise HTTPException(status_code=500, detail=result.errors)
-        
-        return {
-            "success": True,
-            "project_type": result.project_type.name,
-            "structure": result.structure,
-            "stats": result.stats,
-        }
     
     @app.get("/api/scan/{path:path}")
     async def scan_project_get(
         path: str,
         recursive: bool = True,
-        include_hidden: bool = False
+        include_hidden: bool = False,
+        no_cache: bool = False,
+        stream: Optional[str] = Query(None, pattern="^ndjson$"),
+        scanner=Depends(get_scanner)
     ):
         """Scan a project (GET version)."""
-        target = Path(path)
-        if not target.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {path}")
-        
-        result = scanner.scan(target, recursive=recursive, include_hidden=include_hidden)
-        
-        if not result.success:
-            raise HTTPException(status_code=500, detail=result.errors)
-        
-        return {
-            "success": True,
-            "project_type": result.project_type.name,
-            "structure": result.structure,
-            "stats": result.stats,
-        }
+        return await _do_scan(scanner, path, recursive, include_hidden, no_cache, stream)
     
     # ==================== BUILD ====================
     
-    @app.post("/api/build")
-    async def build_structure(request: BuildRequest):
+    # The body is decoded by hand so the structure skips pydantic's
+    # recursive validation; the BuildRequest schema still documents it
+    @app.post("/api/build", openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": BuildRequest.model_json_schema()}},
+        },
+    })
+    async def build_structure(request: Request,
+                              offset: int = Query(0, ge=0),
+                              limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+                              builder=Depends(get_builder)):
         """Build project structure from definition."""
-        output = Path(request.output_path)
-        
-        result = builder.build(
-            request.structure,
-            output,
-            force=request.force,
-            dry_run=request.dry_run
-        )
+        structure, meta = _parse_build_body(await request.body())
+        output = Path(meta.output_path)
+        
+        if structure:
+            result = await _run_blocking(
+                builder.build,
+                structure,
+                output,
+                force=meta.force,
+                dry_run=meta.dry_run
+            )
+        else:
+            # Nothing to build; the builder returns without I/O
+            result = builder.build(structure, output)
         
         if not result.success:
             raise HTTPException(status_code=500, detail=result.errors)
         
-        return {
+        operations, page = _page(result.operations, offset, limit)
+        return FastJSONResponse({
             "success": True,
             "stats": result.stats,
-            "operations": [op.to_dict() for op in result.operations[:100]],
-        }
+            "operations": operations,
+            **page,
+        })
     
     @app.post("/api/parse")
-    async def parse_structure(content: str = Query(...), format: str = Query("auto")):
+    async def parse_structure(content: str = Query(...), format: str = Query("auto"),
+                              parser=Depends(get_parser)):
         """Parse structure from text."""
-        result = parser.parse(content, format if format != "auto" else None)
+        result = await _parse_cached(parser, content, format if format != "auto" else None)
         
         if not result.success:
             raise HTTPException(status_code=400, detail=result.errors)
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "format_detected": result.format_detected.name,
             "structure": result.structure,
             "stats": result.stats,
-        }
+        })
     
     # ==================== EXTRACT ====================
     
     @app.post("/api/extract")
-    async def extract_content(request: ExtractRequest):
+    async def extract_content(request: ExtractRequest,
+                              offset: int = Query(0, ge=0),
+                              limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+                              scanner=Depends(get_scanner),
+                              extractor=Depends(get_extractor)):
         """Extract project content with metadata."""
-        path = Path(request.path)
-        
-        if not path.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {request.path}")
+        path = _resolve(request.path)
         
         # Scan first
-        scan_result = scanner.scan(path)
+        scan_result = await _scan_cached(scanner, path, no_cache=request.no_cache)
         if not scan_result.success:
             raise HTTPException(status_code=500, detail=scan_result.errors)
         
+        files = [f for f in scan_result.files if f.is_file]
         if request.include_content:
-            extract_result = extractor.extract(scan_result.files)
-            files_data = [f.to_dict() for f in extract_result.files[:100]]
+            # Only the requested page of files is read
+            page_files = files[offset:offset + limit]
+            extract_result = await _run_blocking(extractor.extract, page_files)
+            files_data = [f.to_dict() for f in extract_result.files]
+            end = offset + len(page_files)
+            page = {"total": len(files), "next_offset": end if end < len(files) else None}
         else:
             files_data = []
+            page = {"total": len(files), "next_offset": None}
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "structure": scan_result.structure,
             "stats": scan_result.stats,
             "files": files_data,
-        }
+            **page,
+        })
     
     @app.get("/api/extract/export")
     async def export_structure(
         path: str,
         format: str = "json",
+        no_cache: bool = False,
+        scanner=Depends(get_scanner),
+        exporter=Depends(get_exporter),
     ):
         """Export structure to file."""
-        target = Path(path)
-        if not target.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+        target = _resolve(path)
         
-        result = scanner.scan(target)
+        result = await _scan_cached(scanner, target, no_cache=no_cache)
         if not result.success:
             raise HTTPException(status_code=500, detail=result.errors)
         
-        format_map = {
-            'json': ExportFormat.JSON,
-            'txt': ExportFormat.TXT,
-            'md': ExportFormat.MARKDOWN,
-            'yaml': ExportFormat.YAML,
-            'html': ExportFormat.HTML,
-        }
-        
-        fmt = format_map.get(format.lower(), ExportFormat.JSON)
-        
-        # Export to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix=f'.{format}', delete=False) as f:
-            temp_path = Path(f.name)
+        fmt = _FORMAT_MAP.get(format.lower(), ExportFormat.JSON)
         
-        export_result = exporter.export_structure(result.structure, temp_path, fmt)
-        
-        if export_result.success:
-            return FileResponse(
-                temp_path,
-                filename=f"structure.{format}",
-                media_type="application/octet-stream"
-            )
-        else:
-            raise HTTPException(status_code=500, detail=export_result.errors)
+        # Stream chunks as they are serialized instead of staging a temp file
+        return StreamingResponse(
+            exporter.iter_export_structure(result.structure, fmt),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="structure.{_FORMAT_EXTENSIONS[fmt]}"'},
+        )
     
     # ==================== SEARCH ====================
     
     @app.post("/api/search")
-    async def search_in_project(request: SearchRequest):
+    async def search_in_project(request: SearchRequest, search=Depends(get_search)):
         """Search in project files."""
-        path = Path(request.path)
-        
-        if not path.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {request.path}")
+        path = _resolve(request.path)
         
         if request.search_content:
-            result = search.search_content(
+            result = await _run_blocking(
+                search.search_content,
                 path,
                 request.pattern,
                 is_regex=request.is_regex,
                 case_sensitive=request.case_sensitive
             )
         else:
-            result = search.search_filename(
+            result = await _run_blocking(
+                search.search_filename,
                 path,
                 request.pattern,
                 is_regex=request.is_regex,
                 case_sensitive=request.case_sensitive
             )
         
-        return result.to_dict()
+        return FastJSONResponse(result.to_dict())
     
     @app.get("/api/search/todos")
-    async def search_todos(path: str):
+    async def search_todos(path: str, search=Depends(get_search)):
         """Search for TODO/FIXME markers."""
-        target = Path(path)
-        if not target.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+        target = _resolve(path)
         
-        result = search.search_todos(target)
-        return result.to_dict()
+        result = await _run_blocking(search.search_todos, target)
+        return FastJSONResponse(result.to_dict())
     
     # ==================== COMPARE ====================
     
     @app.post("/api/compare")
-    async def compare_projects(request: CompareRequest):
+    async def compare_projects(request: CompareRequest,
+                               offset: int = Query(0, ge=0),
+                               limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+                               diff=Depends(get_diff)):
         """Compare two project structures."""
-        old_path = Path(request.old_path)
-        new_path = Path(request.new_path)
-        
-        if not old_path.exists():
-            raise HTTPException(status_code=404, detail=f"Old path not found: {request.old_path}")
-        if not new_path.exists():
-            raise HTTPException(status_code=404, detail=f"New path not found: {request.new_path}")
-        
-        result = diff.compare_directories(old_path, new_path)
-        
-        return {
-            "stats": result.stats,
-            "added": [item.to_dict() for item in result.added_items[:50]],
-            "removed": [item.to_dict() for item in result.removed_items[:50]],
-            "modified": [item.to_dict() for item in result.modified_items[:50]],
-        }
+        old_path = _resolve(request.old_path, "Old path")
+        new_path = _resolve(request.new_path, "New path")
+        
+        result = await _run_blocking(diff.compare_directories, old_path, new_path)
+        
+        # The same offset/limit window applies to each change list
+        response = {"stats": result.stats, "total": {}, "next_offset": None}
+        for key, items in (("added", result.added_items),
+                           ("removed", result.removed_items),
+                           ("modified", result.modified_items)):
+            response[key], page = _page(items, offset, limit)
+            response["total"][key] = page["total"]
+            if page["next_offset"] is not None:
+                response["next_offset"] = page["next_offset"]
+        return FastJSONResponse(response)
     
     # ==================== ANALYZE ====================
     
     @app.get("/api/analyze")
-    async def analyze_project(path: str):
+    async def analyze_project(path: str, no_cache: bool = False,
+                              analyzer=Depends(get_analyzer)):
         """Analyze code quality and metrics."""
-        target = Path(path)
-        if not target.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+        target = _resolve(path)
         
-        result = analyzer.analyze_directory(target)
-        return result
+        result = await _run_cached(
+            'analyze', target, (), no_cache, analyzer.analyze_directory, target
+        )
+        return FastJSONResponse(result)
     
     # ==================== STATISTICS ====================
     
     @app.get("/api/statistics")
-    async def get_statistics(path: str):
+    async def get_statistics(path: str, no_cache: bool = False, stats=Depends(get_stats)):
         """Get project statistics."""
-        target = Path(path)
-        if not target.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+        target = _resolve(path)
         
-        analysis = stats.analyze(target)
-        return analysis.to_dict()
+        analysis = await _run_cached('statistics', target, (), no_cache, stats.analyze, target)
+        return FastJSONResponse(analysis.to_dict())
     
     @app.get("/api/statistics/duplicates")
-    async def find_duplicates(path: str, limit: int = 20):
+    async def find_duplicates(path: str,
+                              offset: int = Query(0, ge=0),
+                              limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+                              no_cache: bool = False,
+                              stats=Depends(get_stats)):
         """Find duplicate files."""
-        target = Path(path)
-        if not target.exists():
-            raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+        target = _resolve(path)
         
-        duplicates = stats.find_duplicates(target)
-        return {
+        duplicates = await _run_cached(
+            'duplicates', target, (), no_cache, stats.find_duplicates, target
+        )
+        page_items, page = _page(duplicates, offset, limit)
+        return FastJSONResponse({
             "count": len(duplicates),
-            "duplicates": [d.to_dict() for d in duplicates[:limit]]
-        }
+            "duplicates": page_items,
+            **page,
+        })
     
     return app
 
@@ -388,14 +744,42 @@ else:
     app = None
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000):
-    """Run the API server."""
+def run_server(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None):
+    """
+    Run the API server.
+    
+    Uses uvloop and httptools when installed. Worker processes default to
+    the SM_WORKERS environment variable, or 1.
+    """
     if not FASTAPI_AVAILABLE:
         print("FastAPI not installed. Run: pip install fastapi uvicorn")
         return
     
     import uvicorn
-    uvicorn.run(app, host=host, port=port)
+    
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    
+    workers = workers or int(os.getenv("SM_WORKERS", "1"))
+    uvicorn.run(
+        # Multiple workers each import the app themselves
+        "src.web.api:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        loop=loop,
+        http=http,
+        access_log=False,
+        workers=workers,
+    )
 
 
 if __name__ == "__main__":
@@ -4,12 +4,37 @@ Pytest configuration and fixtures.
 """
 
 import pytest
-import tempfile
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+try:
+    import pyfakefs  # noqa: F401
+    PYFAKEFS_AVAILABLE = True
+except ImportError:
+    PYFAKEFS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _pretty_json(data) -> str:
+    """JSON with 2-space indentation, as json.dumps(data, indent=2) writes it."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    import json
+    return json.dumps(data, indent=2)
+
+
+# Serialized once for every test using sample_json_structure
+_SAMPLE_JSON = _pretty_json({
+    'src': {
+        'main.py': None,
+        'utils.py': None,
+    },
+    'tests': {},
+})
 
 
 @pytest.fixture(scope='session')
@@ -18,6 +43,17 @@ def project_root():
     return Path(__file__).parent.parent
 
 
+@pytest.fixture(scope='session')
+def validator():
+    """One StructureValidator shared by every test module; tests never change its ignore patterns."""
+    from src.modules.validator import StructureValidator
+    validator = StructureValidator()
+    # Warm-up run so the first test doesn't pay for the cold name-check path;
+    # no output path, so nothing touches the filesystem
+    validator.validate({'file.txt': None})
+    return validator
+
+
 @pytest.fixture
 def sample_structure():
     """Create sample structure for testing."""
@@ -61,14 +97,7 @@ def sample_tree_text():
 @pytest.fixture
 def sample_json_structure():
     """Create sample JSON structure string."""
-    import json
-    return json.dumps({
-        'src': {
-            'main.py': None,
-            'utils.py': None,
-        },
-        'tests': {},
-    }, indent=2)
+    return _SAMPLE_JSON
 
 
 @pytest.fixture
@@ -82,24 +111,42 @@ README.md'''
 
 
 @pytest.fixture
-def temp_project_dir():
-    """Create a temporary directory with sample project structure."""
-    with tempfile.TemporaryDirectory() as td:
-        base = Path(td)
-        
-        # Create structure
-        (base / 'src').mkdir()
-        (base / 'src' / 'main.py').write_text('# Main file\nprint("Hello")')
-        (base / 'src' / 'utils').mkdir()
-        (base / 'src' / 'utils' / 'helpers.py').write_text('# Helpers\n\ndef helper():\n    pass')
-        
-        (base / 'tests').mkdir()
-        (base / 'tests' / 'test_main.py').write_text('# Tests\n\ndef test_example():\n    assert True')
-        
-        (base / 'README.md').write_text('# Test Project\n\nDescription here.')
-        (base / 'requirements.txt').write_text('pytest>=7.0\nclick>=8.0')
-        
+def temp_root(request):
+    """
+    Empty directory for tests that write files.
+    
+    Backed by pyfakefs's in-memory filesystem when it is installed;
+    tests marked integration always get a real temporary directory.
+    """
+    if PYFAKEFS_AVAILABLE and request.node.get_closest_marker('integration') is None:
+        request.getfixturevalue('fs')
+        base = Path('/project')
+        base.mkdir()
         yield base
+    else:
+        import tempfile
+        with tempfile.TemporaryDirectory() as td:
+            yield Path(td)
+
+
+@pytest.fixture
+def temp_project_dir(temp_root):
+    """Create a temporary directory with sample project structure."""
+    base = temp_root
+    
+    # Create structure
+    (base / 'src').mkdir()
+    (base / 'src' / 'main.py').write_text('# Main file\nprint("Hello")')
+    (base / 'src' / 'utils').mkdir()
+    (base / 'src' / 'utils' / 'helpers.py').write_text('# Helpers\n\ndef helper():\n    pass')
+    
+    (base / 'tests').mkdir()
+    (base / 'tests' / 'test_main.py').write_text('# Tests\n\ndef test_example():\n    assert True')
+    
+    (base / 'README.md').write_text('# Test Project\n\nDescription here.')
+    (base / 'requirements.txt').write_text('pytest>=7.0\nclick>=8.0')
+    
+    return base
 
 
 @pytest.fixture
@@ -0,0 +1,4 @@
+"""
+Stracture-Master - Performance Tests
+Micro-benchmarks guarding against complexity regressions.
+"""
@@ -0,0 +1,43 @@
+"""
+Stracture-Master - Validator Benchmarks
+Micro-benchmarks for StructureValidator.validate.
+"""
+
+import random
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+pytestmark = pytest.mark.slow
+
+
+# (files, depth); timings are checked against saved runs with
+# --benchmark-compare-fail rather than fixed limits
+_SCENARIOS = [
+    (100, 3),
+    (10_000, 3),
+    (100, 20),
+]
+
+
+def _build_structure(n: int, depth: int) -> dict:
+    """Spread n files over directories nested depth - 1 levels deep, seeded by the size."""
+    rng = random.Random(f'{n}x{depth}')
+    root = {}
+    for i in range(n):
+        node = root
+        for _ in range(depth - 1):
+            node = node.setdefault(f'dir{rng.randrange(8)}', {})
+        node[f'file{i}.txt'] = None
+    return root
+
+
+@pytest.mark.parametrize('n,depth', _SCENARIOS,
+                         ids=[f'N{n}-D{d}' for n, d in _SCENARIOS])
+def test_validate_perf(benchmark, validator, tmp_path, n, depth):
+    """Time validate() alone; the structure is built before measuring."""
+    structure = _build_structure(n, depth)
+    
+    result = benchmark(validator.validate, structure, tmp_path)
+    
+    assert result.is_valid
@@ -0,0 +1,348 @@
+"""
+Stracture-Master - Web API Tests
+Unit tests for the REST API.
+"""
+
+import json
+import os
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+import anyio
+from fastapi.testclient import TestClient
+
+from src.web import api
+
+
+class CountingProxy:
+    """Wrap a provider's module and count calls to its methods."""
+    
+    def __init__(self, target):
+        self._target = target
+        self.calls = []
+    
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        
+        def counted(*args, **kwargs):
+            self.calls.append(name)
+            return attr(*args, **kwargs)
+        return counted
+
+
+@pytest.fixture
+def client():
+    """Test client with empty result and parse caches."""
+    api._result_cache.clear()
+    api._parse_cache.clear()
+    with TestClient(api.app) as test_client:
+        yield test_client
+    api.app.dependency_overrides.clear()
+    api._result_cache.clear()
+    api._parse_cache.clear()
+
+
+@pytest.fixture
+def scanner():
+    """Counting scanner used by the scan routes."""
+    proxy = CountingProxy(api.get_scanner())
+    api.app.dependency_overrides[api.get_scanner] = lambda: proxy
+    return proxy
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small project tree to scan."""
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'main.py').write_text('print("hi")\n')
+    (tmp_path / 'README.md').write_text('# demo\n')
+    return tmp_path
+
+
+class TestResultCache:
+    """Tests for the scan/analyze/statistics result cache."""
+    
+    def scan(self, client, path, **params):
+        """GET a scan of path and return the JSON body."""
+        response = client.get(f'/api/scan/{path}', params=params)
+        assert response.status_code == 200
+        return response.json()
+    
+    def test_repeat_request_is_cached(self, client, scanner, project):
+        """Test that an unchanged path is scanned once."""
+        first = self.scan(client, project)
+        second = self.scan(client, project)
+        
+        assert scanner.calls == ['scan']
+        assert first == second
+    
+    def test_new_file_invalidates(self, client, scanner, project):
+        """Test that adding a file is seen on the next request."""
+        self.scan(client, project)
+        (project / 'setup.py').write_text('')
+        
+        result = self.scan(client, project)
+        
+        assert scanner.calls == ['scan', 'scan']
+        assert result['stats']['total_files'] == 3
+    
+    def test_modified_file_invalidates(self, client, scanner, project):
+        """Test that a newer mtime on a direct child is a cache miss."""
+        self.scan(client, project)
+        readme = project / 'README.md'
+        mtime_ns = readme.stat().st_mtime_ns + 10**9
+        os.utime(readme, ns=(mtime_ns, mtime_ns))
+        
+        self.scan(client, project)
+        
+        assert scanner.calls == ['scan', 'scan']
+    
+    def test_expired_entry_is_refreshed(self, client, scanner, project):
+        """Test that results older than RESULT_CACHE_TTL are not served."""
+        self.scan(client, project)
+        for key, (stored, result) in list(api._result_cache.items()):
+            api._result_cache[key] = (stored - api.RESULT_CACHE_TTL - 1, result)
+        
+        self.scan(client, project)
+        
+        assert scanner.calls == ['scan', 'scan']
+    
+    def test_paths_and_params_have_separate_entries(self, client, scanner, project):
+        """Test that each path and parameter set is cached on its own."""
+        self.scan(client, project)
+        self.scan(client, project / 'src')
+        self.scan(client, project, recursive='false')
+        self.scan(client, project, include_hidden='true')
+        
+        assert scanner.calls == ['scan'] * 4
+        
+        self.scan(client, project / 'src')
+        self.scan(client, project, recursive='false')
+        
+        assert scanner.calls == ['scan'] * 4
+    
+    def test_no_cache_bypasses(self, client, scanner, project):
+        """Test that no_cache always scans."""
+        self.scan(client, project)
+        self.scan(client, project, no_cache='true')
+        
+        assert scanner.calls == ['scan', 'scan']
+
+
+class TestPagination:
+    """Tests for offset/limit paging of list fields."""
+    
+    class Item:
+        """Minimal result item."""
+        
+        def __init__(self, n):
+            self.n = n
+        
+        def to_dict(self):
+            """Serialize as the API does."""
+            return {'n': self.n}
+    
+    @pytest.mark.parametrize('offset,limit,expected,next_offset', [
+        (0, 2, [0, 1], 2),
+        (2, 2, [2, 3], 4),
+        (4, 2, [4], None),
+        (0, 5, [0, 1, 2, 3, 4], None),
+        (9, 2, [], None),
+    ], ids=['first', 'middle', 'last', 'exact', 'past_end'])
+    def test_page(self, offset, limit, expected, next_offset):
+        """Test the page window, total and next offset."""
+        items = [self.Item(n) for n in range(5)]
+        
+        page, meta = api._page(items, offset, limit)
+        
+        assert [d['n'] for d in page] == expected
+        assert meta == {'total': 5, 'next_offset': next_offset}
+    
+    @pytest.fixture
+    def duplicates(self, tmp_path):
+        """Three groups of duplicate files."""
+        for group in range(3):
+            for copy in range(2):
+                (tmp_path / f'g{group}_{copy}.txt').write_text(f'content {group}\n')
+        return tmp_path
+    
+    def test_route_walks_pages(self, client, duplicates):
+        """Test that following next_offset visits every group once."""
+        seen = []
+        offset = 0
+        while offset is not None:
+            response = client.get('/api/statistics/duplicates',
+                                  params={'path': str(duplicates), 'offset': offset, 'limit': 2})
+            assert response.status_code == 200
+            body = response.json()
+            assert body['total'] == 3
+            seen.extend(group['hash'] for group in body['duplicates'])
+            offset = body['next_offset']
+        
+        assert len(seen) == len(set(seen)) == 3
+    
+    @pytest.mark.parametrize('params', [{'limit': 0}, {'limit': api.MAX_PAGE_SIZE + 1},
+                                        {'offset': -1}], ids=['zero', 'too_large', 'negative'])
+    def test_route_rejects_bad_window(self, client, duplicates, params):
+        """Test that out-of-range offset/limit values are rejected."""
+        response = client.get('/api/statistics/duplicates',
+                              params={'path': str(duplicates), **params})
+        
+        assert response.status_code == 422
+
+
+class TestNdjsonScan:
+    """Tests for ?stream=ndjson scans."""
+    
+    def read_lines(self, response):
+        """Parse an NDJSON body into records."""
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        return [json.loads(line) for line in response.text.splitlines()]
+    
+    def test_streams_every_entry(self, client, project):
+        """Test that each file and directory is one JSON line."""
+        records = self.read_lines(client.get(f'/api/scan/{project}', params={'stream': 'ndjson'}))
+        
+        paths = {r['path'].replace(os.sep, '/'): r['type'] for r in records}
+        assert paths == {'src': 'dir', 'src/main.py': 'file', 'README.md': 'file'}
+    
+    def test_post_route_streams(self, client, project):
+        """Test that the POST scan route streams the same entries."""
+        response = client.post('/api/scan', params={'stream': 'ndjson'},
+                               json={'path': str(project), 'recursive': False})
+        
+        assert {r['path'] for r in self.read_lines(response)} == {'src', 'README.md'}
+    
+    def test_rejects_unknown_stream_format(self, client, project):
+        """Test that only ndjson is accepted as a stream format."""
+        response = client.get(f'/api/scan/{project}', params={'stream': 'csv'})
+        
+        assert response.status_code == 422
+    
+    def test_missing_path(self, client, tmp_path):
+        """Test that a missing path is a 404 before streaming starts."""
+        response = client.get(f'/api/scan/{tmp_path / "missing"}', params={'stream': 'ndjson'})
+        
+        assert response.status_code == 404
+    
+    def test_chunks_hold_whole_lines(self, monkeypatch):
+        """Test that chunks split only between records."""
+        monkeypatch.setattr(api, 'NDJSON_CHUNK_SIZE', 64)
+        entries = [(f'dir/file{i}.txt', {'type': 'file', 'size': i}) for i in range(20)]
+        
+        chunks = list(api._ndjson_chunks(entries))
+        
+        assert len(chunks) > 1
+        assert all(chunk.endswith(b'\n') for chunk in chunks)
+        records = [json.loads(line) for line in b''.join(chunks).splitlines()]
+        assert records == [{'path': path, **meta} for path, meta in entries]
+
+
+class TestBuildBody:
+    """Tests for /api/build body parsing."""
+    
+    def build(self, client, body, **params):
+        """POST a raw body to /api/build."""
+        return client.post('/api/build', params=params, content=body,
+                           headers={'content-type': 'application/json'})
+    
+    def test_dry_run(self, client, tmp_path):
+        """Test that a valid body builds its structure tree."""
+        body = json.dumps({'structure': {'pkg': {'mod.py': None}, 'README.md': None},
+                           'output_path': str(tmp_path / 'out'), 'dry_run': True})
+        
+        response = self.build(client, body)
+        
+        assert response.status_code == 200
+        assert response.json()['total'] == 3
+        assert not (tmp_path / 'out').exists()
+    
+    def test_builds_files(self, client, tmp_path):
+        """Test that a real build writes the structure."""
+        body = json.dumps({'structure': {'pkg': {'mod.py': None}},
+                           'output_path': str(tmp_path)})
+        
+        response = self.build(client, body)
+        
+        assert response.status_code == 200
+        assert (tmp_path / 'pkg' / 'mod.py').is_file()
+    
+    @pytest.mark.parametrize('body,loc', [
+        ('{"structure": ', ['body']),
+        ('[1, 2]', ['body']),
+        ('{"output_path": "x"}', ['body', 'structure']),
+        ('{"structure": [], "output_path": "x"}', ['body', 'structure']),
+        ('{"structure": {}}', ['body', 'output_path']),
+        ('{"structure": {}, "output_path": "x", "dry_run": "maybe"}', ['body', 'dry_run']),
+        ('{"structure": {}, "output_path": "x", "bogus": 1}', ['body', 'bogus']),
+    ], ids=['bad_json', 'not_object', 'no_structure', 'structure_type',
+            'no_output_path', 'bad_flag', 'extra_field'])
+    def test_invalid_body(self, client, body, loc):
+        """Test that malformed bodies are 422s pointing at the bad field."""
+        response = self.build(client, body)
+        
+        assert response.status_code == 422
+        assert response.json()['detail'][0]['loc'] == loc
+
+
+class TestParseCache:
+    """Tests for the /api/parse result cache."""
+    
+    @pytest.fixture
+    def parser(self):
+        """Counting parser used by /api/parse."""
+        proxy = CountingProxy(api.get_parser())
+        api.app.dependency_overrides[api.get_parser] = lambda: proxy
+        return proxy
+    
+    def parse(self, client, content):
+        """POST content to /api/parse and return the JSON body."""
+        response = client.post('/api/parse', params={'content': content})
+        assert response.status_code == 200
+        return response.json()
+    
+    def test_same_content_parsed_once(self, client, parser):
+        """Test that repeated content is served from the cache."""
+        first = self.parse(client, 'app/\n  main.py\n')
+        second = self.parse(client, 'app/\n  main.py\n')
+        
+        assert parser.calls == ['parse']
+        assert first == second
+    
+    def test_content_and_format_have_separate_entries(self, client):
+        """Test that each content and format pair is parsed on its own."""
+        calls = []
+        
+        class StubParser:
+            """Parser that echoes its arguments."""
+            
+            def parse(self, content, format_hint):
+                calls.append((content, format_hint))
+                return calls[-1]
+        
+        parser = StubParser()
+        for content, format_hint in [('a/', None), ('b/', None), ('a/', 'TREE'), ('a/', None)]:
+            anyio.run(api._parse_cached, parser, content, format_hint)
+        
+        assert calls == [('a/', None), ('b/', None), ('a/', 'TREE')]
+    
+    def test_evicts_least_recent(self, client, parser, monkeypatch):
+        """Test that the cache keeps at most PARSE_CACHE_SIZE results."""
+        monkeypatch.setattr(api, 'PARSE_CACHE_SIZE', 2)
+        for name in ('a', 'b', 'a', 'c'):
+            self.parse(client, f'{name}.py')
+        
+        assert len(api._parse_cache) == 2
+        self.parse(client, 'a.py')
+        assert parser.calls == ['parse'] * 3
+        self.parse(client, 'b.py')
+        assert parser.calls == ['parse'] * 4
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
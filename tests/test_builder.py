@@ -4,13 +4,9 @@ Unit tests for the builder module.
 """
 
 import pytest
-import tempfile
 from pathlib import Path
-import sys
 import os
 
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
 from src.modules.builder import StructureBuilder, BuildResult
 
 
@@ -23,58 +19,42 @@ class TestStructureBuilder:
         return StructureBuilder()
     
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, temp_root):
         """Create temporary directory for tests."""
-        with tempfile.TemporaryDirectory() as td:
-            yield Path(td)
+        return temp_root
     
     # ==================== BASIC BUILDING ====================
     
-    def test_build_simple_structure(self, builder, temp_dir):
-        """Test building a simple structure."""
-        structure = {
-            'src': {
-                'main.py': None,
-            },
-            'README.md': None
-        }
-        
+    @pytest.mark.parametrize('structure,expected_paths', [
+        pytest.param(
+            {'src': {'main.py': None}, 'README.md': None},
+            {'src': 'dir', 'src/main.py': 'file', 'README.md': 'file'},
+            id='simple',
+        ),
+        pytest.param(
+            {'level1': {'level2': {'level3': {'file.txt': None}}}},
+            {'level1/level2/level3/file.txt': 'file'},
+            id='nested',
+        ),
+        pytest.param(
+            {'empty1': {}, 'empty2': {}},
+            {'empty1': 'dir', 'empty2': 'dir'},
+            id='empty_directories',
+        ),
+        pytest.param(
+            {'single.txt': None},
+            {'single.txt': 'file'},
+            id='single_file',
+        ),
+    ])
+    def test_build(self, builder, temp_dir, structure, expected_paths):
+        """Test building structures creates each expected directory and file."""
         result = builder.build(structure, temp_dir)
         
         assert result.success
-        assert (temp_dir / 'src').is_dir()
-        assert (temp_dir / 'src' / 'main.py').is_file()
-        assert (temp_dir / 'README.md').is_file()
-    
-    def test_build_nested_structure(self, builder, temp_dir):
-        """Test building nested directories."""
-        structure = {
-            'level1': {
-                'level2': {
-                    'level3': {
-                        'file.txt': None
-                    }
-                }
-            }
-        }
-        
-        result = builder.build(structure, temp_dir)
-        
-        assert result.success
-        assert (temp_dir / 'level1' / 'level2' / 'level3' / 'file.txt').is_file()
-    
-    def test_build_empty_directories(self, builder, temp_dir):
-        """Test building empty directories."""
-        structure = {
-            'empty1': {},
-            'empty2': {},
-        }
-        
-        result = builder.build(structure, temp_dir)
-        
-        assert result.success
-        assert (temp_dir / 'empty1').is_dir()
-        assert (temp_dir / 'empty2').is_dir()
+        for relative, kind in expected_paths.items():
+            path = temp_dir / relative
+            assert path.is_dir() if kind == 'dir' else path.is_file(), relative
     
     # ==================== DRY RUN ====================
     
@@ -183,16 +163,19 @@ class TestStructureBuilder:
         assert result.stats['files_created'] == 0
         assert result.stats['directories_created'] == 0
     
-    def test_build_single_file(self, builder, temp_dir):
-        """Test building single file at root."""
+    @pytest.mark.integration
+    def test_build_on_real_filesystem(self, builder, temp_dir):
+        """Test building into a real directory rather than the in-memory one."""
         structure = {
-            'single.txt': None
+            'src': {
+                'main.py': None,
+            },
         }
         
         result = builder.build(structure, temp_dir)
         
         assert result.success
-        assert (temp_dir / 'single.txt').is_file()
+        assert os.path.isfile(os.path.join(temp_dir, 'src', 'main.py'))
 
 
 class TestBuildResult:
@@ -7,9 +7,6 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from src.modules.parser import StructureParser, ParseFormat
 
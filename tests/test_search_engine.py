@@ -0,0 +1,273 @@
+"""
+Stracture-Master - Search Engine Tests
+Unit tests for content search.
+"""
+
+import os
+import pytest
+
+from src.search import search_engine
+from src.search.search_engine import SearchEngine, SearchFilter
+
+
+class TestSearchFilter:
+    """Tests for SearchFilter.matches."""
+    
+    @pytest.fixture
+    def files(self, tmp_path):
+        """One small and one large file inside a build directory."""
+        build = tmp_path / 'build'
+        build.mkdir()
+        (build / 'small.py').write_bytes(b'x')
+        (build / 'large.py').write_bytes(b'x' * 100)
+        return build
+    
+    @staticmethod
+    def _dir_entry(path):
+        """Get the os.scandir entry for path."""
+        return next(e for e in os.scandir(path.parent) if e.name == path.name)
+    
+    @pytest.mark.parametrize('as_type', ['path', 'str', 'dir_entry'])
+    def test_accepts_paths_and_entries(self, files, as_type):
+        """Test that paths, strings and directory entries filter alike."""
+        size_filter = SearchFilter(extensions=['.py'], min_size=10)
+        dir_filter = SearchFilter(exclude_dirs=['build'])
+        as_type = {'path': lambda p: p, 'str': str, 'dir_entry': self._dir_entry}[as_type]
+        
+        assert size_filter.matches(as_type(files / 'large.py'))
+        assert not size_filter.matches(as_type(files / 'small.py'))
+        assert not dir_filter.matches(as_type(files / 'large.py'))
+    
+    def test_uses_given_stat(self, files):
+        """Test that a supplied stat result is used instead of a new one."""
+        size_filter = SearchFilter(min_size=10)
+        
+        assert size_filter.matches(files / 'small.py', (files / 'large.py').stat())
+
+
+class TestContentSearch:
+    """Tests for SearchEngine.search_content."""
+    
+    @pytest.fixture
+    def engine(self):
+        """Create search engine instance."""
+        return SearchEngine(max_workers=2)
+    
+    @pytest.fixture
+    def search(self, engine, tmp_path):
+        """Write one file and search it; content search reads real files."""
+        def run(content: bytes, pattern: str, **kwargs):
+            (tmp_path / 'sample.txt').write_bytes(content)
+            return engine.search_content(tmp_path, pattern, **kwargs)
+        return run
+    
+    # ==================== LINE HANDLING ====================
+    
+    @pytest.mark.parametrize('pattern', [r'alpha\s+beta', r'a[^x]beta', r'alpha.beta'])
+    def test_match_does_not_span_lines(self, search, pattern):
+        """Test that a match never runs across a line break."""
+        result = search(b'alpha\nbeta\n', pattern)
+        
+        assert result.total_matches == 0
+    
+    def test_dot_stops_at_line_end(self, search):
+        """Test that '.*' takes the rest of the line, not the rest of the file."""
+        result = search(b'x TODO: one\nnext line\n', r'TODO.*')
+        
+        assert [m.match_text for m in result.matches] == ['TODO: one']
+    
+    def test_matches_after_a_cross_line_candidate(self, search):
+        """Test that a candidate spanning lines does not hide later matches."""
+        result = search(b'alpha\nbeta alpha beta\n', r'alpha\s+beta')
+        
+        assert [(m.line_number, m.column) for m in result.matches] == [(2, 6)]
+    
+    @pytest.mark.parametrize('pattern,content,expected', [
+        (r'(?<=a)b', b'a\nb\n', []),
+        (r'\Ab', b'a\nb\n', [2]),
+        (r'\B', b'a\n\n', []),
+        (r'^$', b'a\n\nb\n', [2]),
+        (r'^', b'a\nb\n', [1, 2]),
+    ], ids=['lookbehind', 'start_anchor', 'non_boundary', 'empty_line', 'line_start'])
+    def test_patterns_see_one_line(self, search, pattern, content, expected):
+        """Test that anchors and lookarounds behave as on a single line."""
+        result = search(content, pattern)
+        
+        assert [m.line_number for m in result.matches] == expected
+    
+    @pytest.mark.parametrize('content', [b'start\nthe end\n', b'start\r\nthe end\r\n'],
+                             ids=['lf', 'crlf'])
+    def test_dollar_anchors_at_line_end(self, search, content):
+        """Test that $ anchors before both LF and CRLF endings."""
+        result = search(content, r'end$')
+        
+        assert result.total_matches == 1
+        match = result.matches[0]
+        assert match.line_number == 2
+        assert match.match_text == 'end'
+    
+    def test_line_numbers_and_columns(self, search):
+        """Test 1-based line numbers and columns for each match."""
+        result = search(b'one\ntwo foo\nfoo\n', 'foo')
+        
+        positions = sorted((m.line_number, m.column) for m in result.matches)
+        assert positions == [(2, 5), (3, 1)]
+    
+    def test_context_lines(self, search):
+        """Test that context covers the surrounding lines."""
+        result = search(b'a\r\nb\r\nmatch\r\nc\r\nd\r\n', 'match', context_lines=1)
+        
+        assert result.matches[0].context == 'b\nmatch\nc'
+    
+    def test_max_matches_per_file(self, search):
+        """Test that matching stops at the per-file limit."""
+        result = search(b'x x x\nx x\n', 'x', max_matches_per_file=3)
+        
+        assert result.total_matches == 3
+    
+    # ==================== UNICODE ====================
+    
+    @pytest.mark.parametrize('content,pattern,match_text', [
+        ('CAFÉ au lait\n', 'café', 'CAFÉ'),
+        ('a naïve plan\n', r'na\w+ve', 'naïve'),
+        ('über alles\n', r'\bber', None),
+        ('x\u00a0y\n', r'x\sy', 'x\u00a0y'),
+        ('café\n', 'caf.$', 'café'),
+    ], ids=['ignorecase', 'word_class', 'word_boundary', 'space_class', 'dot'])
+    def test_unicode_matching(self, search, content, pattern, match_text):
+        """Test that patterns keep their str meaning on non-ASCII text."""
+        result = search(content.encode('utf-8'), pattern)
+        
+        assert [m.match_text for m in result.matches] == ([match_text] if match_text else [])
+    
+    def test_unicode_column(self, search):
+        """Test that columns count characters, not bytes."""
+        result = search('ééé foo\n'.encode('utf-8'), 'foo')
+        
+        assert result.matches[0].column == 5
+    
+    def test_binary_file_skipped(self, search):
+        """Test that files with NUL bytes are not searched."""
+        result = search(b'needle\x00needle', 'needle')
+        
+        assert result.total_matches == 0
+    
+    def test_invalid_regex(self, search):
+        """Test that an invalid pattern is reported, not raised."""
+        result = search(b'text', '(')
+        
+        assert result.total_matches == 0
+        assert result.errors
+
+
+class TestExecutorChoice:
+    """Tests for how search_content spreads files over workers."""
+    
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Enough plain files to pass the process pool threshold."""
+        for i in range(5):
+            (tmp_path / f'f{i}.txt').write_text(f'line\nneedle {i}\n')
+        return tmp_path
+    
+    @pytest.fixture
+    def pools(self, monkeypatch):
+        """Record the executors search_content creates."""
+        created = []
+        
+        def recording(cls):
+            class Recording(cls):
+                def __init__(self, *args, **kwargs):
+                    created.append((cls.__name__, kwargs))
+                    super().__init__(*args, **kwargs)
+            return Recording
+        
+        monkeypatch.setattr(SearchEngine, 'PROCESS_POOL_MIN_FILES', 2)
+        monkeypatch.setattr(search_engine, '_compile_prefilter', lambda pattern, flags=0: None)
+        monkeypatch.setattr(search_engine, 'ThreadPoolExecutor',
+                            recording(search_engine.ThreadPoolExecutor))
+        monkeypatch.setattr(search_engine, 'ProcessPoolExecutor',
+                            recording(search_engine.ProcessPoolExecutor))
+        return created
+    
+    def test_single_cpu_stays_on_threads(self, tree, pools, monkeypatch):
+        """Test that one CPU never pays for worker processes."""
+        monkeypatch.setattr(search_engine.os, 'cpu_count', lambda: 1)
+        
+        result = SearchEngine(max_workers=2).search_content(tree, 'needle')
+        
+        assert [name for name, _ in pools] == ['ThreadPoolExecutor']
+        assert result.total_matches == 5
+    
+    def test_process_pool_sized_by_cpus(self, tree, pools, monkeypatch):
+        """Test that the process pool has one worker per CPU and does not fork."""
+        monkeypatch.setattr(search_engine.os, 'cpu_count', lambda: 2)
+        
+        result = SearchEngine(max_workers=8).search_content(tree, 'needle')
+        
+        [(name, kwargs)] = pools
+        assert name == 'ProcessPoolExecutor'
+        assert kwargs['max_workers'] == 2
+        assert kwargs['mp_context'].get_start_method() in ('forkserver', 'spawn')
+        assert sorted(m.match_text for m in result.matches) == ['needle'] * 5
+
+
+class TestPrefilters:
+    """Tests for the optional content search prefilters."""
+    
+    @pytest.fixture
+    def todo_tree(self, tmp_path):
+        """Files with and without TODO markers, in LF and CRLF form."""
+        (tmp_path / 'a.py').write_bytes(b'x = 1\n# TODO: fix\n')
+        (tmp_path / 'b.py').write_bytes(b'y = 2\nnothing here\n')
+        (tmp_path / 'c.py').write_bytes(b'z = 3\r\n\r\n# fixme later\r\n')
+        (tmp_path / 'd.py').write_bytes('café\n# HACK\n'.encode('utf-8'))
+        return tmp_path
+    
+    @pytest.fixture
+    def prefilter_calls(self, monkeypatch):
+        """Record the files each Hyperscan prefilter scan sees."""
+        calls = []
+        real = search_engine._prefilter_hit
+        
+        def spy(database, data):
+            calls.append(data)
+            return real(database, data)
+        
+        monkeypatch.setattr(search_engine, '_prefilter_hit', spy)
+        return calls
+    
+    def test_hyperscan_prefilter_runs_for_todos(self, todo_tree, prefilter_calls):
+        """Test that search_todos screens ASCII files with Hyperscan and keeps every hit."""
+        pytest.importorskip('hyperscan')
+        
+        result = SearchEngine(max_workers=2).search_todos(todo_tree)
+        
+        # d.py is not ASCII, so it goes straight to the regex
+        assert len(prefilter_calls) == 3
+        hits = sorted((m.filename, m.line_number, m.match_text) for m in result.matches)
+        assert hits == [('a.py', 2, 'TODO'), ('c.py', 3, 'fixme'), ('d.py', 2, 'HACK')]
+    
+    def test_keyword_prefilter_runs_for_todos(self, todo_tree, monkeypatch):
+        """Test that search_todos screens ASCII files with Aho-Corasick and keeps every hit."""
+        pytest.importorskip('ahocorasick')
+        calls = []
+        real = search_engine._multi_literal_hit
+        
+        def spy(automaton, text):
+            calls.append(text)
+            return real(automaton, text)
+        
+        # Without Hyperscan, the keyword automaton is the prefilter
+        monkeypatch.setattr(search_engine, '_compile_prefilter', lambda pattern, flags=0: None)
+        monkeypatch.setattr(search_engine, '_multi_literal_hit', spy)
+        
+        result = SearchEngine(max_workers=2).search_todos(todo_tree)
+        
+        assert len(calls) == 3
+        hits = sorted((m.filename, m.line_number, m.match_text) for m in result.matches)
+        assert hits == [('a.py', 2, 'TODO'), ('c.py', 3, 'fixme'), ('d.py', 2, 'HACK')]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,148 @@
+"""
+Stracture-Master - Utils Tests
+Unit tests for the utility functions.
+"""
+
+import hashlib
+import os
+import pytest
+
+from src import utils
+from src.utils import Utils
+
+
+class TestBatchReadHeads:
+    """Tests for Utils.batch_read_heads."""
+    
+    @pytest.fixture
+    def files(self, tmp_path):
+        """Files of assorted sizes, plus one path that does not exist."""
+        paths = []
+        for i, size in enumerate([0, 1, 100, 5000, 20000]):
+            path = tmp_path / f'file{i}.bin'
+            path.write_bytes(bytes(range(256)) * (size // 256) + b'x' * (size % 256))
+            paths.append(path)
+        paths.append(tmp_path / 'missing.bin')
+        return paths
+    
+    def test_matches_read_head(self, files):
+        """Test that batched reads return what single reads return."""
+        expected = [Utils._read_head(p, 4096) for p in files]
+        
+        assert Utils.batch_read_heads(files, 4096) == expected
+        assert expected[-1] is None
+    
+    @pytest.mark.skipif(not utils.LIBURING_AVAILABLE, reason="liburing not installed")
+    def test_uring_matches_read_head(self, files):
+        """Test that the io_uring path returns what single reads return."""
+        expected = [Utils._read_head(p, 4096) for p in files]
+        
+        assert Utils._uring_read_heads([str(p) for p in files], 4096) == expected
+    
+    def test_uring_failure_falls_back(self, files, monkeypatch):
+        """Test that any io_uring error falls back to single reads."""
+        def broken(paths, nbytes):
+            raise TypeError("binding mismatch")
+        
+        monkeypatch.setattr(utils, 'LIBURING_AVAILABLE', True)
+        monkeypatch.setattr(Utils, '_uring_read_heads', staticmethod(broken))
+        
+        assert Utils.batch_read_heads(files, 4096) == [Utils._read_head(p, 4096) for p in files]
+
+class TestCopyFile:
+    """Tests for Utils.copy_file."""
+    
+    @pytest.mark.parametrize('size', [0, 1, 3 * 1024 * 1024 + 5])
+    def test_copies_content(self, tmp_path, size):
+        """Test that the copy has the source's bytes."""
+        src = tmp_path / 'src.bin'
+        src.write_bytes(os.urandom(size))
+        
+        assert Utils.copy_file(src, tmp_path / 'out' / 'dst.bin')
+        assert (tmp_path / 'out' / 'dst.bin').read_bytes() == src.read_bytes()
+    
+    @pytest.mark.skipif(not os.path.exists('/proc/version'), reason="needs procfs")
+    def test_copies_procfs_file(self, tmp_path):
+        """Test that files copy_file_range sees as empty are still copied."""
+        with open('/proc/version', 'rb') as f:
+            content = f.read()
+        
+        assert Utils.copy_file('/proc/version', tmp_path / 'version')
+        assert (tmp_path / 'version').read_bytes() == content
+    
+    @pytest.mark.parametrize('broken', [['copy_file_range'], ['copy_file_range', 'sendfile']],
+                             ids=['copy_file_range', 'both'])
+    def test_no_progress_falls_back(self, tmp_path, monkeypatch, broken):
+        """Test that kernel copies returning 0 at once fall back to a read/write copy."""
+        for name in broken:
+            if hasattr(os, name):
+                monkeypatch.setattr(os, name, lambda *args: 0)
+        src = tmp_path / 'src.bin'
+        src.write_bytes(b'data' * 1000)
+        
+        assert Utils.copy_file(src, tmp_path / 'dst.bin')
+        assert (tmp_path / 'dst.bin').read_bytes() == src.read_bytes()
+
+
+class TestParseTreeString:
+    """Tests for Utils.parse_tree_string."""
+    
+    def test_space_indent(self):
+        """Test that deeper indents nest under the last directory."""
+        tree = 'app/\n  src/\n    main.py\n  README.md\nsetup.py'
+        
+        assert Utils.parse_tree_string(tree) == {
+            'app': {'src': {'main.py': None}, 'README.md': None},
+            'setup.py': None,
+        }
+    
+    def test_tree_characters_count_as_indent(self):
+        """Test that tree drawing characters set the depth like spaces."""
+        tree = '\n'.join([
+            'project/',
+            '├── src/',
+            '│   ├── main.py',
+            '│   └── utils/',
+            '│       └── helpers.py',
+            '├── tests/',
+            '└── README.md',
+        ])
+        
+        assert Utils.parse_tree_string(tree) == {
+            'project': {
+                'src': {'main.py': None, 'utils': {'helpers.py': None}},
+                'tests': {},
+                'README.md': None,
+            },
+        }
+    
+    def test_blank_and_prefix_only_lines_skipped(self):
+        """Test that empty and tree-character-only lines do not reset nesting."""
+        tree = 'app/\n\n  a.py\n  │\n  b.py\n'
+        
+        assert Utils.parse_tree_string(tree) == {'app': {'a.py': None, 'b.py': None}}
+
+
+class TestFileHash:
+    """Tests for Utils.get_file_hash."""
+    
+    @pytest.mark.parametrize('size', [0, 1, 100_000])
+    def test_matches_hashlib(self, tmp_path, size):
+        """Test that regular files hash to the hashlib digest of their bytes."""
+        path = tmp_path / 'data.bin'
+        path.write_bytes(b'a' * size)
+        
+        assert Utils.get_file_hash(path, 'sha256') == hashlib.sha256(b'a' * size).hexdigest()
+    
+    @pytest.mark.skipif(not os.path.exists('/proc/version'), reason="needs procfs")
+    def test_zero_size_file_with_content(self):
+        """Test that a file reporting size 0 is still read to the end."""
+        with open('/proc/version', 'rb') as f:
+            content = f.read()
+        
+        assert content
+        assert Utils.get_file_hash('/proc/version', 'sha256') == hashlib.sha256(content).hexdigest()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])